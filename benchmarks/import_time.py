@@ -0,0 +1,93 @@
+"""
+Import-time benchmark for the testgen_council package.
+
+Runs ``python -X importtime`` in a fresh interpreter for each entry point, reports the
+cumulative import time and the slowest imports, and fails if any heavy optional backend
+(openai, numpy, scikit-learn, aiohttp, ...) is imported eagerly.
+
+    python benchmarks/import_time.py [--budget-ms 150] [--top 10] [--repeat 5]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ENTRY_POINTS = {
+    'import testgen_council': 'import testgen_council',
+    'testgen-council --help': 'import testgen_council.cli as c; c.build_parser().format_help()',
+    'pipeline classes': 'from testgen_council import AsyncIntelligentTestCouncil',
+}
+
+HEAVY_MODULES = [
+    'openai', 'numpy', 'sklearn', 'scipy', 'aiohttp', 'torch', 'transformers',
+    'sentence_transformers', 'matplotlib', 'seaborn', 'pandas', 'ipywidgets'
+]
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(statement: str):
+    """Return (package import records, all imported top-level module names) for one fresh run"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get('PYTHONPATH')])))
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                          capture_output=True, text=True, env=env, cwd=REPO_ROOT)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{proc.stderr}")
+
+    records = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append({'module': module, 'self_us': int(self_us),
+                            'cumulative_us': int(cumulative_us), 'depth': len(indent) // 2})
+    return records
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help='fail if the median cumulative import time of an entry point exceeds this')
+    parser.add_argument('--top', type=int, default=10, help='number of slowest imports to list')
+    parser.add_argument('--repeat', type=int, default=5, help='fresh interpreter runs per entry point')
+    args = parser.parse_args()
+
+    failed = False
+    for label, statement in ENTRY_POINTS.items():
+        runs = [measure(statement) for _ in range(args.repeat)]
+        totals_ms = [sum(r['cumulative_us'] for r in records if r['depth'] == 0) / 1000 for records in runs]
+        median_ms = statistics.median(totals_ms)
+        package_ms = statistics.median(
+            max((r['cumulative_us'] for r in records if r['module'] == 'testgen_council'), default=0) / 1000
+            for records in runs
+        )
+
+        print(f"\n⏱️  {label}")
+        print(f"   • Total import time (median of {args.repeat}): {median_ms:.1f} ms")
+        print(f"   • testgen_council/__init__: {package_ms:.1f} ms")
+
+        print(f"   • Slowest imports (self time):")
+        for record in sorted(runs[-1], key=lambda r: r['self_us'], reverse=True)[:args.top]:
+            print(f"       {record['self_us'] / 1000:8.2f} ms  {record['module']}")
+
+        loaded = {r['module'].split('.')[0] for r in runs[-1]}
+        heavy = sorted(loaded.intersection(HEAVY_MODULES))
+        if heavy:
+            print(f"   ❌ Heavy modules imported eagerly: {', '.join(heavy)}")
+            failed = True
+        else:
+            print(f"   ✅ No heavy modules imported")
+
+        if args.budget_ms is not None and median_ms > args.budget_ms:
+            print(f"   ❌ Over budget: {median_ms:.1f} ms > {args.budget_ms:.1f} ms")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+Intelligent Test Council - role-based LLM test generation with AST clustering.
+
+Public classes are imported lazily on first attribute access, so ``import testgen_council``
+stays cheap; heavy optional backends (openai, numpy/scikit-learn, aiohttp) are only
+imported by the code paths that use them.
+"""
+import importlib
+
+__version__ = "0.1.0"
+
+_EXPORTS = {
+    'Config': 'config',
+    'SYNTHESIZER_MODEL': 'config',
+    'CodeAnalyzer': 'analyzer',
+    'LLMCouncil': 'council',
+    'TestClassifier': 'classifier',
+    'ASTNormalizer': 'clustering',
+    'ASTClusterer': 'clustering',
+    'TestSynthesizer': 'synthesizer',
+    'CoverageAnalyzer': 'coverage_analyzer',
+    'FunctionResult': 'results',
+    'RawResponseStore': 'results',
+    'TestCodePool': 'results',
+    'IntelligentTestCouncil': 'pipeline',
+    'AsyncIntelligentTestCouncil': 'pipeline',
+    'TestGenerationService': 'service',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f'.{_EXPORTS[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
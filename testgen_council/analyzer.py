@@ -0,0 +1,72 @@
+"""Code analysis and AST processing."""
+import ast
+import re
+from typing import Any, Dict, List
+
+
+class CodeAnalyzer:
+    """Analyzes Python code and extracts function information using AST"""
+    
+    @staticmethod
+    def extract_function_info(code: str) -> Dict[str, Any]:
+        """Extract function information from Python code"""
+        try:
+            # Clean up the code string and ensure proper formatting
+            code = code.strip()
+            
+            # Try to parse with ast
+            tree = ast.parse(code)
+            functions = []
+            
+            for node in ast.walk(tree):
+                if isinstance(node, ast.FunctionDef):
+                    # Get function source by reconstructing from lines
+                    lines = code.split('\n')
+                    start_line = node.lineno - 1
+                    end_line = node.end_lineno if hasattr(node, 'end_lineno') else len(lines)
+                    
+                    func_source = '\n'.join(lines[start_line:end_line])
+                    
+                    func_info = {
+                        'name': node.name,
+                        'args': [arg.arg for arg in node.args.args],
+                        'docstring': ast.get_docstring(node),
+                        'source_code': func_source,
+                        'line_start': node.lineno,
+                        'line_end': node.end_lineno if hasattr(node, 'end_lineno') else len(lines)
+                    }
+                    functions.append(func_info)
+            
+            return {
+                'functions': functions,
+                'total_functions': len(functions),
+                'source_code': code
+            }
+            
+        except SyntaxError as e:
+            print(f"Syntax error parsing code: {e}")
+            print(f"Error at line {e.lineno}: {e.text}")
+            print(f"Code that failed to parse:\n{code}")
+            return {'functions': [], 'total_functions': 0, 'source_code': code, 'syntax_error': str(e)}
+        except Exception as e:
+            print(f"Error parsing code: {e}")
+            return {'functions': [], 'total_functions': 0, 'source_code': code, 'error': str(e)}
+    
+    @staticmethod
+    def extract_test_methods_from_response(response: str) -> List[Dict[str, str]]:
+        """Extract individual test methods from LLM response"""
+        test_methods = []
+        
+        # Try to find test functions using regex
+        test_pattern = r'def (test_\w+)\([^)]*\):(.*?)(?=def test_|\Z)'
+        matches = re.findall(test_pattern, response, re.DOTALL)
+        
+        for match in matches:
+            func_name, func_body = match
+            full_test = f"def {func_name}():{func_body}"
+            test_methods.append({
+                'name': func_name,
+                'code': full_test.strip()
+            })
+        
+        return test_methods
@@ -0,0 +1,50 @@
+"""Test classification by category with role tracking."""
+import re
+from typing import Any, Dict, List
+
+from .config import Config
+
+
+class TestClassifier:
+    """Classifies test cases by category and tracks role assignments"""
+    
+    @staticmethod
+    def extract_category_from_test(test_code: str) -> str:
+        """Extract category from test code comments"""
+        category_pattern = r'#\s*Category:\s*(\w+)'
+        match = re.search(category_pattern, test_code, re.IGNORECASE)
+        
+        if match:
+            category = match.group(1).lower()
+            if category in Config.TEST_CATEGORIES:
+                return category
+        
+        # Fallback classification based on test name and content
+        test_code_lower = test_code.lower()
+        
+        if 'error' in test_code_lower or 'exception' in test_code_lower or 'invalid' in test_code_lower:
+            return 'negative'
+        elif 'boundary' in test_code_lower or 'edge' in test_code_lower or 'limit' in test_code_lower:
+            return 'boundary'
+        elif 'security' in test_code_lower or 'auth' in test_code_lower or 'injection' in test_code_lower:
+            return 'security'
+        else:
+            return 'positive'
+    
+    @staticmethod
+    def classify_council_results(council_results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Classify all test cases from council results with role information"""
+        all_classified_tests = []
+        
+        for model_name, role_results in council_results.items():
+            for role_id, results in role_results.items():
+                for test in results['test_methods']:
+                    category = TestClassifier.extract_category_from_test(test['code'])
+                    classified_test = test.copy()
+                    classified_test['category'] = category
+                    classified_test['source_model'] = model_name
+                    classified_test['source_role'] = role_id
+                    classified_test['role_name'] = results['role_name']
+                    all_classified_tests.append(classified_test)
+        
+        return all_classified_tests
@@ -0,0 +1,255 @@
+"""
+Command-line interface: ``testgen-council generate|batch|serve``.
+
+Only the standard library is imported at module level; the pipeline (and with it
+openai, numpy/scikit-learn or aiohttp) is imported inside the subcommand that needs it.
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import re
+import sys
+from typing import Any, Dict, List
+
+BATCH_CSV_COLUMNS = [
+    'function_name', 'original_tests', 'final_tests', 'reduction_ratio', 'coverage_percentage',
+    'models_used', 'categories_count', 'categories', 'synthesizer_model', 'success', 'error'
+]
+
+
+def _read_source(path: str) -> str:
+    if path == '-':
+        return sys.stdin.read()
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def load_batch_functions(source: str) -> List[Dict[str, Any]]:
+    """
+    Load functions for a batch run
+
+    Args:
+        source: A dataset JSON file (as written by generate-dataset.ipynb, i.e.
+            {"metadata": ..., "functions": [{"source", "name", ...}]} or a plain list),
+            a single .py file, or a directory of .py files (one function per file)
+    """
+    if os.path.isdir(source):
+        functions = []
+        for filename in sorted(os.listdir(source)):
+            if filename.endswith('.py'):
+                path = os.path.join(source, filename)
+                functions.append({'name': filename[:-3], 'source': _read_source(path), 'file': path})
+        return functions
+
+    if source.endswith('.py'):
+        return [{'name': os.path.basename(source)[:-3], 'source': _read_source(source), 'file': source}]
+
+    with open(source, 'r', encoding='utf-8') as f:
+        dataset = json.load(f)
+    functions = dataset['functions'] if isinstance(dataset, dict) else dataset
+    return [fn if isinstance(fn, dict) else {'source': fn} for fn in functions]
+
+
+def _batch_row(index: int, function: Dict[str, Any], results: Dict[str, Any]) -> Dict[str, Any]:
+    """One batch_evaluation.csv row (same columns as the notebook's batch_evaluate_functions)"""
+    fallback_name = function.get('name') or f'function_{index + 1}'
+
+    if 'error' in results:
+        return {
+            'function_name': fallback_name, 'original_tests': 0, 'final_tests': 0,
+            'reduction_ratio': 0, 'coverage_percentage': 0, 'models_used': 0,
+            'categories_count': 0, 'categories': '', 'synthesizer_model': '',
+            'success': False, 'error': results['error']
+        }
+
+    stats = results['statistics']
+    func_info = results['function_info']
+    return {
+        'function_name': func_info['functions'][0]['name'] if func_info['functions'] else fallback_name,
+        'original_tests': stats['original_test_count'],
+        'final_tests': stats['final_test_count'],
+        'reduction_ratio': stats['reduction_ratio'],
+        'coverage_percentage': stats['coverage_percentage'],
+        'models_used': len(stats['models_used']),
+        'categories_count': len(stats['categories_found']),
+        'categories': ','.join(stats['categories_found']),
+        'synthesizer_model': stats['synthesizer_model'],
+        'success': True,
+        'error': ''
+    }
+
+
+def _print_summary(results: Dict[str, Any], output_dir: str):
+    if 'error' in results:
+        print(f"❌ {results['error']}")
+        return
+
+    stats = results['statistics']
+    print(f"\n📊 Summary:")
+    print(f"   • Original tests: {stats['original_test_count']}")
+    print(f"   • Final tests: {stats['final_test_count']}")
+    print(f"   • Reduction ratio: {stats['reduction_ratio']:.2%}")
+    print(f"   • Coverage: {stats['coverage_percentage']:.1f}%")
+    print(f"   • Categories: {', '.join(stats['categories_found'])}")
+    print(f"📁 Results saved to {output_dir}")
+
+
+def cmd_generate(args) -> int:
+    from .config import Config
+    from .pipeline import AsyncIntelligentTestCouncil
+
+    function_code = _read_source(args.file)
+    council = AsyncIntelligentTestCouncil(Config())
+    results = asyncio.run(council.generate_comprehensive_tests_async(
+        function_code,
+        max_concurrent=args.max_concurrent,
+        clustering_method=args.clustering,
+        output_dir=args.output_dir,
+        iterative=args.iterative
+    ))
+    _print_summary(results, args.output_dir)
+    return 1 if 'error' in results else 0
+
+
+async def _run_batch(councils, functions: List[Dict[str, Any]], args) -> List[Dict[str, Any]]:
+    """Run the pipeline over functions, one council per concurrent slot (councils are not shared)"""
+    idle_councils = asyncio.Queue()
+    for council in councils:
+        idle_councils.put_nowait(council)
+    rows = [None] * len(functions)
+
+    async def run_one(index: int, function: Dict[str, Any]):
+        name = function.get('name') or f'function_{args.offset + index + 1}'
+        safe_name = re.sub(r'[^\w.-]', '_', name)
+        output_dir = os.path.join(args.output_dir, f"{args.offset + index:05d}_{safe_name}")
+        council = await idle_councils.get()
+        try:
+            print(f"\n📝 Processing function {index + 1}/{len(functions)}: {name}")
+            try:
+                results = await council.generate_comprehensive_tests_async(
+                    function['source'],
+                    max_concurrent=args.max_concurrent,
+                    clustering_method=args.clustering,
+                    output_dir=output_dir,
+                    iterative=args.iterative
+                )
+            except Exception as e:
+                results = {'error': str(e)}
+        finally:
+            idle_councils.put_nowait(council)
+        rows[index] = _batch_row(args.offset + index, function, results)
+        if rows[index]['success']:
+            print(f"✅ Function {index + 1} processed successfully")
+        else:
+            print(f"❌ Error processing function {index + 1}: {rows[index]['error']}")
+
+    await asyncio.gather(*(run_one(i, fn) for i, fn in enumerate(functions)))
+    return rows
+
+
+def cmd_batch(args) -> int:
+    from .config import Config
+    from .pipeline import AsyncIntelligentTestCouncil
+
+    functions = load_batch_functions(args.source)
+    end = args.offset + args.limit if args.limit is not None else None
+    functions = functions[args.offset:end]
+    print(f"🔄 Starting batch evaluation of {len(functions)} functions...")
+
+    councils = [AsyncIntelligentTestCouncil(Config()) for _ in range(max(1, args.jobs))]
+    rows = asyncio.run(_run_batch(councils, functions, args))
+
+    with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=BATCH_CSV_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    successful = [row for row in rows if row['success']]
+    print(f"\n📊 Batch Evaluation Summary:")
+    print(f"   • Successful runs: {len(successful)}/{len(rows)}")
+    if successful:
+        def mean(key):
+            return sum(row[key] for row in successful) / len(successful)
+        print(f"   • Average original tests: {mean('original_tests'):.1f}")
+        print(f"   • Average final tests: {mean('final_tests'):.1f}")
+        print(f"   • Average reduction ratio: {mean('reduction_ratio'):.2%}")
+        print(f"   • Average coverage: {mean('coverage_percentage'):.1f}%")
+    print(f"📁 Detailed results saved to {args.csv}")
+    return 0 if len(successful) == len(rows) else 1
+
+
+def cmd_serve(args) -> int:
+    from aiohttp import web
+
+    from .config import Config
+    from .service import TestGenerationService
+
+    service = TestGenerationService(
+        Config(),
+        data_dir=args.data_dir,
+        pipeline_workers=args.pipeline_workers,
+        coverage_workers=args.coverage_workers,
+        max_concurrent=args.max_concurrent
+    )
+    host = args.host or Config.SERVICE['host']
+    port = args.port or Config.SERVICE['port']
+    print(f"🌐 Test generation service listening on http://{host}:{port}")
+    web.run_app(service.create_app(), host=host, port=port, print=None)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='testgen-council',
+        description='Generate pytest suites with a role-based LLM council and AST clustering.'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_pipeline_options(sub, default_output_dir):
+        sub.add_argument('-o', '--output-dir', default=default_output_dir,
+                         help=f'directory for generated tests and metadata (default: {default_output_dir})')
+        sub.add_argument('--clustering', choices=['hash', 'vector'], default='vector',
+                         help="'hash' for fast clustering, 'vector' for DBSCAN clustering "
+                              "(needs the [vector] extra; default: vector)")
+        sub.add_argument('--iterative', action='store_true',
+                         help='use coverage-guided iterative generation (Config.ITERATIVE_GENERATION)')
+        sub.add_argument('--max-concurrent', type=int, default=7,
+                         help='maximum concurrent API requests per function (default: 7)')
+
+    generate = subparsers.add_parser('generate', help='generate tests for a single function')
+    generate.add_argument('file', help="Python file containing the function ('-' reads stdin)")
+    add_pipeline_options(generate, 'test_results')
+    generate.set_defaults(handler=cmd_generate)
+
+    batch = subparsers.add_parser('batch', help='generate tests for many functions and write a CSV report')
+    batch.add_argument('source', help='dataset JSON (see generate-dataset.ipynb), .py file or directory of .py files')
+    add_pipeline_options(batch, 'batch_results')
+    batch.add_argument('--csv', default='batch_evaluation.csv',
+                       help='evaluation report path (default: batch_evaluation.csv)')
+    batch.add_argument('--offset', type=int, default=0, help='skip the first N functions')
+    batch.add_argument('--limit', type=int, default=None, help='process at most N functions')
+    batch.add_argument('--jobs', type=int, default=1,
+                       help='functions processed concurrently (default: 1)')
+    batch.set_defaults(handler=cmd_batch)
+
+    serve = subparsers.add_parser('serve', help='run the local test generation service (needs the [service] extra)')
+    serve.add_argument('--host', default=None, help="bind address (default: Config.SERVICE['host'])")
+    serve.add_argument('--port', type=int, default=None, help="port (default: Config.SERVICE['port'])")
+    serve.add_argument('--data-dir', default=None, help='job database and result directory')
+    serve.add_argument('--pipeline-workers', type=int, default=None, help='pipeline runs executed concurrently')
+    serve.add_argument('--coverage-workers', type=int, default=None, help='coverage subprocesses executed concurrently')
+    serve.add_argument('--max-concurrent', type=int, default=None, help='concurrent API requests per pipeline run')
+    serve.set_defaults(handler=cmd_serve)
+
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""AST normalization and structural clustering of tests."""
+import ast
+import hashlib
+from typing import Any, Dict, List, Tuple
+
+
+class ASTNormalizer:
+    """Normalizes AST for structural comparison"""
+    
+    def __init__(self):
+        self.var_counter = 0
+        self.var_map = {}
+    
+    def normalize_ast(self, tree: ast.AST) -> ast.AST:
+        """Normalize an AST by anonymizing variables and canonicalizing structure"""
+        self.var_counter = 0
+        self.var_map = {}
+        return self._normalize_node(tree)
+    
+    def _normalize_node(self, node: ast.AST) -> ast.AST:
+        """Recursively normalize AST nodes"""
+        if isinstance(node, ast.Name):
+            # Anonymize variable names
+            if node.id not in self.var_map:
+                self.var_map[node.id] = f"var_{self.var_counter}"
+                self.var_counter += 1
+            node.id = self.var_map[node.id]
+        
+        elif isinstance(node, ast.FunctionDef):
+            # Normalize function names (except test functions)
+            if not node.name.startswith('test_'):
+                node.name = "func"
+            # Remove docstrings
+            if (node.body and isinstance(node.body[0], ast.Expr) and
+                isinstance(node.body[0].value, (ast.Str, ast.Constant))):
+                node.body = node.body[1:]
+        
+        elif isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            # Sort literals in collections for canonicalization (if all are constants)
+            try:
+                if all(isinstance(elt, ast.Constant) for elt in node.elts):
+                    node.elts = sorted(node.elts, key=lambda x: str(x.value))
+            except:
+                pass
+        
+        # Recursively process child nodes
+        for field, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        self._normalize_node(item)
+            elif isinstance(value, ast.AST):
+                self._normalize_node(value)
+        
+        return node
+
+
+class ASTClusterer:
+    """Clusters test functions based on structural similarity using AST analysis"""
+    
+    # ASTNormalizer keeps per-call state, so each hash/vector gets its own normalizer:
+    # one clusterer is shared by concurrent pipeline runs (service workers, batch --jobs)
+    
+    def parse_test_to_ast(self, test_code: str) -> Tuple[ast.AST, bool]:
+        """Parse test code to AST, return (tree, success)"""
+        try:
+            tree = ast.parse(test_code)
+            return tree, True
+        except SyntaxError as e:
+            print(f"⚠️  Syntax error in test code: {e}")
+            return None, False
+    
+    def get_structural_hash(self, test_code: str) -> str:
+        """Generate structural hash from normalized AST"""
+        tree, success = self.parse_test_to_ast(test_code)
+        if not success or tree is None:
+            return hashlib.md5(test_code.encode()).hexdigest()
+        
+        # Normalize the AST
+        normalized_tree = ASTNormalizer().normalize_ast(tree)
+        
+        # Convert to string and hash
+        ast_str = ast.dump(normalized_tree, annotate_fields=False)
+        return hashlib.md5(ast_str.encode()).hexdigest()
+    
+    def vectorize_ast(self, test_code: str) -> 'np.ndarray':
+        """Convert AST to numerical feature vector"""
+        import numpy as np
+        
+        tree, success = self.parse_test_to_ast(test_code)
+        if not success or tree is None:
+            return np.zeros(20)
+        
+        # Normalize the AST
+        normalized_tree = ASTNormalizer().normalize_ast(tree)
+        
+        # Extract structural features
+        features = {
+            'num_nodes': 0,
+            'num_functions': 0,
+            'num_calls': 0,
+            'num_asserts': 0,
+            'num_comparisons': 0,
+            'num_binops': 0,
+            'num_unaryops': 0,
+            'num_if': 0,
+            'num_for': 0,
+            'num_while': 0,
+            'num_with': 0,
+            'num_try': 0,
+            'num_raise': 0,
+            'max_depth': 0,
+            'num_literals': 0,
+            'num_list': 0,
+            'num_dict': 0,
+            'num_tuple': 0,
+            'has_pytest_raises': 0,
+            'num_attributes': 0
+        }
+        
+        def count_nodes(node, depth=0):
+            features['num_nodes'] += 1
+            features['max_depth'] = max(features['max_depth'], depth)
+            
+            if isinstance(node, ast.FunctionDef):
+                features['num_functions'] += 1
+            elif isinstance(node, ast.Call):
+                features['num_calls'] += 1
+                # Check for pytest.raises
+                if isinstance(node.func, ast.Attribute):
+                    if node.func.attr == 'raises':
+                        features['has_pytest_raises'] = 1
+            elif isinstance(node, ast.Assert):
+                features['num_asserts'] += 1
+            elif isinstance(node, ast.Compare):
+                features['num_comparisons'] += 1
+            elif isinstance(node, ast.BinOp):
+                features['num_binops'] += 1
+            elif isinstance(node, ast.UnaryOp):
+                features['num_unaryops'] += 1
+            elif isinstance(node, ast.If):
+                features['num_if'] += 1
+            elif isinstance(node, ast.For):
+                features['num_for'] += 1
+            elif isinstance(node, ast.While):
+                features['num_while'] += 1
+            elif isinstance(node, ast.With):
+                features['num_with'] += 1
+            elif isinstance(node, ast.Try):
+                features['num_try'] += 1
+            elif isinstance(node, ast.Raise):
+                features['num_raise'] += 1
+            elif isinstance(node, (ast.Constant, ast.Num, ast.Str)):
+                features['num_literals'] += 1
+            elif isinstance(node, ast.List):
+                features['num_list'] += 1
+            elif isinstance(node, ast.Dict):
+                features['num_dict'] += 1
+            elif isinstance(node, ast.Tuple):
+                features['num_tuple'] += 1
+            elif isinstance(node, ast.Attribute):
+                features['num_attributes'] += 1
+            
+            for child in ast.iter_child_nodes(node):
+                count_nodes(child, depth + 1)
+        
+        count_nodes(normalized_tree)
+        
+        # Convert to numpy array
+        return np.array(list(features.values()), dtype=float)
+    
+    def cluster_tests(self, tests: List[Dict[str, Any]], 
+                     method: str = 'vector', 
+                     eps: float = 0.3, 
+                     min_samples: int = 2) -> Dict[int, List[int]]:
+        """
+        Cluster tests based on structural similarity
+        
+        Args:
+            tests: List of test dictionaries with 'code' field
+            method: 'hash' for simple hashing, 'vector' for feature-based clustering
+            eps: DBSCAN epsilon parameter (for vector method)
+            min_samples: DBSCAN min_samples parameter (for vector method)
+        
+        Returns:
+            Dictionary mapping cluster_id to list of test indices
+        """
+        print(f"🔬 Clustering {len(tests)} tests using {method} method...")
+        
+        if method == 'hash':
+            return self._cluster_by_hash(tests)
+        elif method == 'vector':
+            return self._cluster_by_vector(tests, eps, min_samples)
+        else:
+            raise ValueError(f"Unknown clustering method: {method}")
+    
+    def _cluster_by_hash(self, tests: List[Dict[str, Any]]) -> Dict[int, List[int]]:
+        """Fast clustering using structural hashes"""
+        hash_to_indices = {}
+        
+        for idx, test in enumerate(tests):
+            struct_hash = self.get_structural_hash(test['code'])
+            if struct_hash not in hash_to_indices:
+                hash_to_indices[struct_hash] = []
+            hash_to_indices[struct_hash].append(idx)
+        
+        # Convert to cluster format
+        clusters = {}
+        for cluster_id, indices in enumerate(hash_to_indices.values()):
+            clusters[cluster_id] = indices
+        
+        # Calculate statistics
+        singleton_clusters = sum(1 for indices in clusters.values() if len(indices) == 1)
+        multi_test_clusters = len(clusters) - singleton_clusters
+        
+        print(f"✅ Hash-based clustering complete:")
+        print(f"   • Total clusters: {len(clusters)}")
+        print(f"   • Singleton clusters (unique tests): {singleton_clusters}")
+        print(f"   • Multi-test clusters (duplicates found): {multi_test_clusters}")
+        
+        return clusters
+    
+    def _cluster_by_vector(self, tests: List[Dict[str, Any]], 
+                          eps: float, min_samples: int) -> Dict[int, List[int]]:
+        """Advanced clustering using AST feature vectors (numpy/scikit-learn imported on first use)"""
+        try:
+            import numpy as np
+            from sklearn.cluster import DBSCAN
+            from sklearn.preprocessing import StandardScaler
+        except ImportError as e:
+            raise ImportError(
+                f"Vector clustering requires numpy and scikit-learn ({e}). "
+                "Install them with `pip install testgen-council[vector]` or use method='hash'."
+            ) from e
+        
+        # Vectorize all tests
+        vectors = np.array([self.vectorize_ast(test['code']) for test in tests])
+        
+        # Normalize features
+        scaler = StandardScaler()
+        vectors_normalized = scaler.fit_transform(vectors)
+        
+        # Cluster with DBSCAN
+        dbscan = DBSCAN(eps=eps, min_samples=min_samples, metric='euclidean')
+        labels = dbscan.fit_predict(vectors_normalized)
+        
+        # Organize by cluster
+        clusters = {}
+        for idx, label in enumerate(labels):
+            if label == -1:  # Noise points get individual clusters
+                label = max(clusters.keys(), default=-1) + 1
+            if label not in clusters:
+                clusters[label] = []
+            clusters[label].append(idx)
+        
+        # Calculate statistics
+        singleton_clusters = sum(1 for indices in clusters.values() if len(indices) == 1)
+        multi_test_clusters = len(clusters) - singleton_clusters
+        avg_cluster_size = np.mean([len(indices) for indices in clusters.values()])
+        
+        print(f"✅ Vector-based clustering complete:")
+        print(f"   • Total clusters: {len(clusters)}")
+        print(f"   • Singleton clusters: {singleton_clusters}")
+        print(f"   • Multi-test clusters: {multi_test_clusters}")
+        print(f"   • Average cluster size: {avg_cluster_size:.2f}")
+        
+        return clusters
@@ -0,0 +1,205 @@
+"""Configuration: models, role personas, model-role assignments and pipeline settings."""
+import os
+
+SYNTHESIZER_MODEL = "gemini-2.0-flash"
+
+
+class Config:
+    """Configuration class for the intelligent council system"""
+    
+    # API Keys (read from the environment)
+    OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
+    
+    # Base URLs for different providers
+    OPENAI_BASE_URL = os.environ.get("OPENAI_BASE_URL", "https://api.gapgpt.app/v1")
+    
+    # Model configurations
+    LLM_MODELS = {
+        "gemini-2.0-flash": {
+            "type": "openai",
+            "model_name": "gemini-2.0-flash",
+            "base_url": OPENAI_BASE_URL,
+            "api_key": OPENAI_API_KEY,
+        },
+        "grok-3-mini": {
+            "type": "openai", 
+            "model_name": "grok-3-mini",
+            "base_url": OPENAI_BASE_URL,
+            "api_key": OPENAI_API_KEY,
+        },
+        "qwen3-235b-a22b": {
+            "type": "openai",
+            "model_name": "qwen3-235b-a22b",
+            "base_url": OPENAI_BASE_URL,
+            "api_key": OPENAI_API_KEY,
+        }
+    }
+    
+    # Role-Based Test Generation Personas
+    ROLES = {
+        "qa_engineer": {
+            "name": "By-the-Book QA Engineer",
+            "philosophy": "Meticulous and systematic. Focuses on covering the function's explicit requirements.",
+            "focus_categories": ["positive", "boundary"],
+            "prompt_persona": """You are a meticulous QA Engineer with 15 years of experience in software testing. Your primary goal is to verify that the function behaves exactly as described in its documentation.
+
+YOUR MISSION:
+- Generate high-quality, standard tests that cover the core functionality
+- Focus on positive test cases (normal, expected usage)
+- Test boundary conditions explicitly mentioned in the specification
+- Ensure every part of the docstring's promise is tested
+- Write clear, maintainable tests that serve as documentation
+
+APPROACH:
+1. Read the function signature and docstring carefully
+2. Identify all promised behaviors
+3. Create tests for typical use cases
+4. Test boundary values (min, max, empty, single element)
+5. Verify return types and value ranges match specifications
+
+Generate well-structured tests following pytest best practices."""
+        },
+        
+        "agent_of_chaos": {
+            "name": "Agent of Chaos",
+            "philosophy": "If it can break, I will find a way. Make the function fail.",
+            "focus_categories": ["negative", "edge_case"],
+            "prompt_persona": """You are a destructive tester known as the "Agent of Chaos". Your mission is to BREAK this function by any means necessary.
+
+YOUR MISSION:
+- Find every possible way the function can fail
+- Generate tests that SHOULD raise exceptions
+- Think about unexpected, malformed, or adversarial inputs
+- Test with wrong types, None values, empty data structures
+- Push the function beyond its limits
+
+ATTACK VECTORS TO CONSIDER:
+1. Type violations (pass string when int expected, etc.)
+2. Null/None inputs where objects are expected
+3. Empty collections ([], {}, "")
+4. Extreme values (very large numbers, very long strings)
+5. Negative numbers where positive expected
+6. Zero division scenarios
+7. Invalid combinations of parameters
+8. Corrupted or malformed data structures
+
+Generate tests that you expect will raise specific exceptions (TypeError, ValueError, IndexError, ZeroDivisionError, etc.). Use pytest.raises() to verify these failures."""
+        },
+        
+        "security_auditor": {
+            "name": "Paranoid Security Auditor",
+            "philosophy": "Trust nothing. Assume all input is hostile.",
+            "focus_categories": ["security", "negative"],
+            "prompt_persona": """You are a cybersecurity expert and penetration tester. Your task is to find security vulnerabilities in this code.
+
+YOUR MISSION:
+- Analyze the function for potential security flaws
+- Generate tests that attempt to exploit vulnerabilities
+- Think like an attacker trying to compromise the system
+
+SECURITY CONCERNS TO TEST:
+1. **Injection Attacks**: SQL injection, command injection, code injection
+2. **Path Traversal**: Attempts to access files outside intended directory (../, absolute paths)
+3. **Buffer Overflow**: Oversized inputs that might cause issues
+4. **Format String Attacks**: Special characters in strings (%s, %d, {}, etc.)
+5. **Insecure Deserialization**: Malicious pickled objects or JSON
+6. **Input Validation Bypass**: Special characters, Unicode, null bytes
+7. **Resource Exhaustion**: Inputs that could cause infinite loops or memory issues
+8. **Data Leakage**: Can the function expose sensitive information?
+
+Generate security-focused tests. If the function has file operations, test path traversal. If it processes strings, test injection. If it handles numbers, test integer overflow. If no obvious vulnerabilities exist, test with security-minded inputs (special characters, scripts, oversized data)."""
+        },
+        
+        "abstract_thinker": {
+            "name": "Abstract Thinker",
+            "philosophy": "Test the underlying properties and invariants, not just specific cases.",
+            "focus_categories": ["positive", "boundary", "edge_case"],
+            "prompt_persona": """You are a computer scientist specializing in formal methods and property-based testing. Your goal is to verify the fundamental mathematical and logical properties of this function.
+
+YOUR MISSION:
+- Think beyond specific test cases to general properties
+- Identify invariants that must always hold
+- Create tests that verify logical consistency
+- Check mathematical properties and relationships
+
+PROPERTIES TO CONSIDER:
+1. **Identity Properties**: f(x) with some operation returns x
+2. **Inverse Properties**: decode(encode(x)) == x
+3. **Idempotency**: f(f(x)) == f(x) for some functions
+4. **Commutativity**: Does order matter? f(a,b) == f(b,a)?
+5. **Associativity**: f(f(a,b),c) == f(a,f(b,c))?
+6. **Preservation Properties**: Input length = output length?
+7. **Boundary Properties**: For sorted output, output[i] <= output[i+1]
+8. **Type Invariants**: Output type consistent with specification?
+9. **Domain/Range Properties**: All outputs within valid range?
+
+Generate property-based tests. You may use standard pytest format or suggest hypothesis library tests. Focus on testing fundamental truths about the function's behavior rather than specific input-output pairs."""
+        }
+    }
+    
+    # Model-Role Assignment Strategy
+    # This assigns each model to specific roles based on hypothesized strengths
+    # You can modify this based on your experimental results
+
+    # MODEL_ROLE_ASSIGNMENTS = {
+    #     "gemini-2.0-flash": ["qa_engineer", "abstract_thinker"],
+    #     "grok-3-mini": ["agent_of_chaos", "security_auditor"],
+    #     "qwen3-235b-a22b": ["qa_engineer", "agent_of_chaos"]
+    # }
+    
+    MODEL_ROLE_ASSIGNMENTS = {
+        "gemini-2.0-flash": ["qa_engineer", "abstract_thinker", "agent_of_chaos"],
+        "grok-3-mini": ["qa_engineer", "agent_of_chaos"],
+        "qwen3-235b-a22b": ["abstract_thinker", "security_auditor"]
+    }
+    
+    # Coverage-guided iterative generation (AsyncIntelligentTestCouncil, iterative=True)
+    # A cheap first wave runs first; follow-up roles are only dispatched while
+    # coverage of function.py or category targets are still unmet.
+    ITERATIVE_GENERATION = {
+        "first_wave_roles": ["qa_engineer"],   # Roles consulted before any coverage is measured
+        "target_coverage": 95.0,               # Line + branch coverage (%) of function.py
+        "required_categories": ["positive", "negative", "boundary"],
+        "max_rounds": 3,                       # Follow-up rounds after the first wave
+        "followups_per_round": 2,              # Model-role calls dispatched per follow-up round
+        "max_llm_calls": None                  # Generation call budget (None = size of a full council run)
+    }
+
+    # Cluster representative selection (TestSynthesizer)
+    # Clusters whose members agree on behaviour and outcome get a locally scored
+    # representative; only disagreeing clusters are sent to the synthesis LLM.
+    LOCAL_SELECTION = {
+        "enabled": True,
+        "quick_execution": True,           # Run cluster members once with pytest to get pass/fail
+        "quick_execution_timeout": 30,     # Seconds for the whole quick run
+        "weights": {
+            "passes": 3.0,                 # Test passed in the quick run
+            "assertions": 1.0,             # Assertion / pytest.raises count (saturates at 5)
+            "messages": 1.0,               # Share of assertions with a message or match=
+            "consensus": 2.0,              # Category equals the cluster's majority category
+            "centrality": 1.0              # Mean AST similarity to the other members
+        }
+    }
+
+    # Raw LLM responses are kept out of line in a content-addressed blob store
+    # (shared across functions so batch runs keep only compact results in memory)
+    RAW_RESPONSE_STORE_DIR = "raw_responses"
+
+    # Local test-generation service (job queue + worker pools, see TestGenerationService)
+    SERVICE = {
+        "host": "127.0.0.1",
+        "port": 8765,
+        "data_dir": "service_data",        # SQLite job queue and per-job result directories
+        "pipeline_workers": 2,             # Pipeline runs executed concurrently
+        "coverage_workers": 2,             # pytest/coverage subprocesses executed concurrently
+        "max_concurrent_llm_calls": 7      # Concurrent API requests within one pipeline run
+    }
+
+    # Test categories (kept for backward compatibility)
+    TEST_CATEGORIES = [
+        "positive",    # مثبت - حالات عادی
+        "negative",    # منفی - حالات خطا
+        "boundary",    # مرزی - مقادیر حدی
+        "edge_case",   # موارد استثنایی
+        "security"     # امنیتی
+    ]
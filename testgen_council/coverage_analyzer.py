@@ -0,0 +1,194 @@
+"""Coverage analysis by running generated tests with pytest-cov."""
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from typing import Any, Dict
+
+
+class CoverageAnalyzer:
+    """Analyzes code coverage and test execution results"""
+    
+    @staticmethod
+    def analyze_coverage(source_code: str, test_code: str, output_dir: str = None,
+                         branch: bool = False) -> Dict[str, Any]:
+        """
+        Analyze code coverage by executing tests
+        
+        Args:
+            source_code: Source code of the function
+            test_code: Test code
+            output_dir: Optional directory containing function.py and test files
+            branch: Also measure branch coverage (needed for branch gaps)
+        
+        Returns dictionary with coverage metrics and test results
+        """
+        print("📊 Analyzing code coverage...")
+        
+        if output_dir and os.path.exists(output_dir):
+            # Use existing output directory (absolute: pytest runs with cwd=work_dir)
+            work_dir = os.path.abspath(output_dir)
+            cleanup = False
+            print(f"   Using output directory: {output_dir}")
+        else:
+            # Create temporary directory
+            work_dir = tempfile.mkdtemp()
+            cleanup = True
+            print(f"   Using temporary directory")
+        
+        try:
+            # Write source code to function.py
+            function_file = os.path.join(work_dir, 'function.py')
+            with open(function_file, 'w') as f:
+                f.write(source_code)
+            
+            # Write test code to test_function.py
+            test_file = os.path.join(work_dir, 'test_function.py')
+            with open(test_file, 'w') as f:
+                f.write(test_code)
+            
+            # Run pytest with coverage
+            pytest_args = ['pytest', test_file, '--cov=function', '--cov-report=json', 
+                           '--tb=short', '-v']
+            if branch:
+                pytest_args.append('--cov-branch')
+            
+            result = subprocess.run(
+                pytest_args,
+                cwd=work_dir,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            
+            # Parse pytest output for test results
+            test_results = CoverageAnalyzer._parse_pytest_output(result.stdout)
+            
+            # Read coverage report
+            coverage_file = os.path.join(work_dir, 'coverage.json')
+            coverage_data = {}
+            if os.path.exists(coverage_file):
+                with open(coverage_file, 'r') as f:
+                    coverage_data = json.load(f)
+            
+            # Extract coverage percentage
+            coverage_percentage = 0.0
+            if 'totals' in coverage_data:
+                coverage_percentage = coverage_data['totals'].get('percent_covered', 0.0)
+            
+            print(f"✅ Coverage analysis complete:")
+            print(f"   • Code coverage: {coverage_percentage:.1f}%")
+            print(f"   • Tests run: {test_results['total_tests']}")
+            print(f"   • Tests passed: {test_results['passed_tests']}")
+            print(f"   • Tests failed: {test_results['failed_tests']}")
+            
+            return {
+                'coverage_percentage': coverage_percentage,
+                'coverage_data': coverage_data,
+                'test_results': result.stdout,
+                'test_stderr': result.stderr,
+                'return_code': result.returncode,
+                'total_tests': test_results['total_tests'],
+                'passed_tests': test_results['passed_tests'],
+                'failed_tests': test_results['failed_tests'],
+                'skipped_tests': test_results['skipped_tests'],
+                'error_tests': test_results['error_tests'],
+                'success_rate': test_results['success_rate']
+            }
+            
+        except subprocess.TimeoutExpired:
+            print("⚠️  Coverage analysis timed out")
+            return {
+                'coverage_percentage': 0.0,
+                'error': 'Timeout during test execution',
+                'total_tests': 0,
+                'passed_tests': 0,
+                'failed_tests': 0,
+                'success_rate': 0.0
+            }
+        except Exception as e:
+            print(f"⚠️  Coverage analysis error: {e}")
+            return {
+                'coverage_percentage': 0.0,
+                'error': str(e),
+                'total_tests': 0,
+                'passed_tests': 0,
+                'failed_tests': 0,
+                'success_rate': 0.0
+            }
+        finally:
+            # Cleanup temporary directory if created
+            if cleanup:
+                shutil.rmtree(work_dir, ignore_errors=True)
+    
+    @staticmethod
+    def extract_coverage_gaps(coverage_data: Dict[str, Any], source_code: str,
+                              filename: str = 'function.py') -> Dict[str, Any]:
+        """
+        Extract uncovered lines and branches of the function file from a coverage.json report
+        
+        Args:
+            coverage_data: Parsed coverage.json (as returned in 'coverage_data')
+            source_code: Source code that was written to function.py
+            filename: Name of the measured source file
+        
+        Returns dictionary with missing lines (quoted from the source) and missing branches
+        """
+        file_data = {}
+        for path, data in coverage_data.get('files', {}).items():
+            if os.path.basename(path) == filename:
+                file_data = data
+                break
+        
+        source_lines = source_code.split('\n')
+        missing_lines = sorted(file_data.get('missing_lines', []))
+        missing_line_sources = [
+            (line_no, source_lines[line_no - 1].rstrip())
+            for line_no in missing_lines
+            if 0 < line_no <= len(source_lines)
+        ]
+        missing_branches = [tuple(branch) for branch in file_data.get('missing_branches', [])]
+        
+        return {
+            'coverage_percentage': file_data.get('summary', {}).get('percent_covered', 0.0),
+            'missing_lines': missing_lines,
+            'missing_line_sources': missing_line_sources,
+            'missing_branches': missing_branches,
+            'has_gaps': bool(missing_lines or missing_branches)
+        }
+    
+    @staticmethod
+    def _parse_pytest_output(output: str) -> Dict[str, Any]:
+        """Parse pytest output to extract test results"""
+        results = {
+            'total_tests': 0,
+            'passed_tests': 0,
+            'failed_tests': 0,
+            'skipped_tests': 0,
+            'error_tests': 0,
+            'success_rate': 0.0
+        }
+        
+        # Look for summary line like "5 passed, 2 failed in 0.50s"
+        summary_pattern = r'(\d+)\s+passed|(\d+)\s+failed|(\d+)\s+skipped|(\d+)\s+error'
+        matches = re.findall(summary_pattern, output)
+        
+        for match in matches:
+            if match[0]:  # passed
+                results['passed_tests'] = int(match[0])
+            elif match[1]:  # failed
+                results['failed_tests'] = int(match[1])
+            elif match[2]:  # skipped
+                results['skipped_tests'] = int(match[2])
+            elif match[3]:  # error
+                results['error_tests'] = int(match[3])
+        
+        results['total_tests'] = (results['passed_tests'] + results['failed_tests'] + 
+                                 results['skipped_tests'] + results['error_tests'])
+        
+        if results['total_tests'] > 0:
+            results['success_rate'] = (results['passed_tests'] / results['total_tests']) * 100
+        
+        return results
@@ -0,0 +1,601 @@
+"""Main pipeline orchestrators (synchronous and async)."""
+import ast
+import asyncio
+import functools
+import json
+import os
+from collections import Counter
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Tuple
+
+from .analyzer import CodeAnalyzer
+from .classifier import TestClassifier
+from .config import Config
+from .council import LLMCouncil
+from .coverage_analyzer import CoverageAnalyzer
+from .results import FunctionResult, RawResponseStore, TestCodePool
+from .synthesizer import TestSynthesizer
+
+
+class IntelligentTestCouncil:
+    """Main orchestrator for intelligent role-based test generation with hybrid clustering"""
+    
+    def __init__(self, config: Config):
+        self.config = config
+        self.code_analyzer = CodeAnalyzer()
+        self.llm_council = LLMCouncil(config)
+        self.test_classifier = TestClassifier()
+        self.test_synthesizer = TestSynthesizer(self.llm_council)
+        self.coverage_analyzer = CoverageAnalyzer()
+        self.test_code_pool = TestCodePool()
+        self.raw_response_store = RawResponseStore(config.RAW_RESPONSE_STORE_DIR)
+        
+    def generate_comprehensive_tests(self, function_code: str, 
+                                     clustering_method: str = 'vector',
+                                     output_dir: str = 'test_results') -> Dict[str, Any]:
+        """
+        Main pipeline for generating comprehensive test suite with hybrid clustering
+        
+        Args:
+            function_code: Source code of function to test
+            clustering_method: 'hash' for fast clustering, 'vector' for advanced DBSCAN clustering
+            output_dir: Directory to save results
+        """
+        print("🚀 Starting Role-Based Intelligent Test Council with Hybrid Clustering")
+        print("=" * 70)
+        
+        # Step 1: Analyze the input function
+        print("\n📝 Step 1: Analyzing input function...")
+        function_info = self.code_analyzer.extract_function_info(function_code)
+        
+        if not function_info['functions']:
+            error_msg = 'No functions found in the provided code'
+            if 'syntax_error' in function_info:
+                error_msg += f". Syntax error: {function_info['syntax_error']}"
+            return {'error': error_msg}
+        
+        print(f"✅ Found {function_info['total_functions']} function(s)")
+        
+        # Step 2: Generate tests using role-based LLM council
+        print("\n🎭 Step 2: Consulting Role-Based LLM Council...")
+        council_results = self.llm_council.generate_tests_from_council(function_info)
+        
+        # Step 3: Classify all test cases
+        print("\n🏷️  Step 3: Classifying test cases by category and role...")
+        all_classified_tests = self.test_classifier.classify_council_results(council_results)
+        
+        print(f"✅ Total tests generated: {len(all_classified_tests)}")
+        
+        # Display distributions
+        role_counts = Counter(test['role_name'] for test in all_classified_tests)
+        category_counts = Counter(test['category'] for test in all_classified_tests)
+        
+        print("\n🎭 Role distribution:")
+        for role_name, count in role_counts.items():
+            print(f"   • {role_name}: {count} tests")
+        
+        print("\n📊 Category distribution:")
+        for category, count in category_counts.items():
+            print(f"   • {category}: {count} tests")
+        
+        # Step 4: Hybrid Cluster-then-Synthesize approach
+        print(f"\n🔬 Step 4: Hybrid Cluster-then-Synthesize Deduplication...")
+        synthesis_results = self.test_synthesizer.synthesize_final_test_file(
+            all_classified_tests, function_info, clustering_method=clustering_method
+        )
+        
+        # Step 5: Save results to output directory
+        print(f"\n💾 Step 5: Saving results to {output_dir}/...")
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Save source function
+        function_file_path = os.path.join(output_dir, 'function.py')
+        with open(function_file_path, 'w') as f:
+            f.write(function_code)
+        print(f"   ✅ Saved source function to: {function_file_path}")
+        
+        # Save test file
+        test_file_path = os.path.join(output_dir, 'test_function.py')
+        with open(test_file_path, 'w') as f:
+            f.write(synthesis_results['synthesized_content'])
+        print(f"   ✅ Saved test file to: {test_file_path}")
+        
+        # Step 6: Analyze coverage using the saved files
+        print("\n📊 Step 6: Analyzing code coverage...")
+        coverage_results = self.coverage_analyzer.analyze_coverage(
+            function_code, 
+            synthesis_results['synthesized_content'],
+            output_dir=output_dir
+        )
+        
+        # Prepare comprehensive results
+        results = {
+            'function_info': function_info,
+            'council_results': council_results,
+            'all_classified_tests': all_classified_tests,
+            'synthesis_results': synthesis_results,
+            'final_test_file': synthesis_results['synthesized_content'],
+            'coverage_results': coverage_results,
+            'output_dir': output_dir,
+            'statistics': {
+                'original_test_count': len(all_classified_tests),
+                'final_test_count': synthesis_results['final_count'],
+                'cluster_count': synthesis_results['cluster_count'],
+                'reduction_ratio': synthesis_results['reduction_ratio'],
+                'clustering_method': clustering_method,
+                'coverage_percentage': coverage_results.get('coverage_percentage', 0.0),
+                'coverage_mode': 'line',
+                'test_success_rate': coverage_results.get('success_rate', 0.0),
+                'total_tests_run': coverage_results.get('total_tests', 0),
+                'passed_tests': coverage_results.get('passed_tests', 0),
+                'failed_tests': coverage_results.get('failed_tests', 0),
+                'models_used': list(council_results.keys()),
+                'roles_used': list(set(test['role_name'] for test in all_classified_tests)),
+                'categories_found': list(category_counts.keys()),
+                'synthesizer_model': synthesis_results['synthesizer_model'],
+                'finalizer_model': synthesis_results.get('finalizer_model', 'fallback'),
+                'selection_tiers': synthesis_results.get('selection_tiers', {}),
+                'tests_per_role': dict(role_counts),
+                'tests_per_category': dict(category_counts),
+            }
+        }
+        
+        # Keep a single copy of each test; raw responses move to the blob store
+        results = FunctionResult.from_results(results, self.test_code_pool, self.raw_response_store)
+        
+        # Save additional metadata
+        self._save_metadata(results, output_dir)
+        
+        print("\n🎉 Pipeline completed successfully!")
+        print(f"📊 Test Success Rate: {coverage_results.get('success_rate', 0.0):.1f}%")
+        print(f"📈 Code Coverage: {coverage_results.get('coverage_percentage', 0.0):.1f}%")
+        print(f"✅ Passed Tests: {coverage_results.get('passed_tests', 0)}/{coverage_results.get('total_tests', 0)}")
+        print(f"📁 Output directory: {output_dir}/")
+        print("=" * 70)
+        
+        return results
+    
+    def save_results(self, results, output_dir: str = None):
+        """
+        Save comprehensive results to files (public method for backward compatibility)
+        
+        Args:
+            results: FunctionResult (or legacy results dictionary) from generate_comprehensive_tests
+            output_dir: Optional output directory (uses results['output_dir'] if not specified)
+        """
+        if not isinstance(results, FunctionResult):
+            results = FunctionResult.from_results(results, self.test_code_pool, self.raw_response_store)
+        
+        if output_dir is None:
+            output_dir = results.output_dir or 'test_results'
+        
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Save source function
+        function_file_path = os.path.join(output_dir, 'function.py')
+        with open(function_file_path, 'w') as f:
+            f.write(results.function_info['source_code'])
+        
+        # Save final test file
+        test_file_path = os.path.join(output_dir, 'test_function.py')
+        with open(test_file_path, 'w') as f:
+            f.write(results.final_test_file)
+        
+        # Save metadata
+        self._save_metadata(results, output_dir)
+        
+        print(f"\n💾 Results saved to: {output_dir}/")
+    
+    def _save_metadata(self, results: FunctionResult, output_dir: str):
+        """Save additional metadata files"""
+        # Save statistics
+        stats_file = os.path.join(output_dir, 'statistics.json')
+        with open(stats_file, 'w') as f:
+            json.dump(results.statistics, f, indent=2)
+        
+        # Save cluster information (cluster ids are positional, indices already native ints)
+        clusters_file = os.path.join(output_dir, 'clusters.json')
+        with open(clusters_file, 'w') as f:
+            json.dump({i: list(indices) for i, indices in enumerate(results.clusters)}, f, indent=2)
+        
+        # Save compact result (tests stored once by content hash, raw responses referenced
+        # from the blob store); reload with FunctionResult.load()
+        results_file = os.path.join(output_dir, 'results.json')
+        with open(results_file, 'w') as f:
+            json.dump(results.to_compact_dict(), f, separators=(',', ':'))
+
+
+class AsyncIntelligentTestCouncil(IntelligentTestCouncil):
+    """Async version of the test council with concurrent API calls"""
+    
+    PIPELINE_STEPS = 6
+    
+    def __init__(self, config: Config, coverage_executor: Executor = None):
+        """
+        Args:
+            config: Council configuration
+            coverage_executor: Optional executor for pytest/coverage runs, including the
+                synthesizer's quick execution (defaults to the event loop's default executor)
+        """
+        super().__init__(config)
+        self.coverage_executor = coverage_executor
+        self.test_synthesizer.executor = coverage_executor
+    
+    async def generate_comprehensive_tests_async(self, function_code: str, 
+                                                 max_concurrent: int = 7,
+                                                 clustering_method: str = 'vector',
+                                                 output_dir: str = 'test_results',
+                                                 iterative: bool = False,
+                                                 progress_callback: Callable[[int, str], None] = None) -> Dict[str, Any]:
+        """
+        Async version of main pipeline with concurrent API calls
+        
+        Args:
+            function_code: Source code of function to test
+            max_concurrent: Maximum number of concurrent API requests
+            clustering_method: 'hash' for fast clustering, 'vector' for advanced DBSCAN clustering
+            output_dir: Directory to save results
+            iterative: Use coverage-guided iterative generation (config.ITERATIVE_GENERATION)
+                instead of consulting every assigned role up front
+            progress_callback: Optional callback(step, message) invoked as each of the
+                PIPELINE_STEPS starts (and for every iterative generation round)
+        """
+        def report(step: int, message: str):
+            if progress_callback is not None:
+                progress_callback(step, message)
+        
+        print("🚀 Starting Role-Based Intelligent Test Council Pipeline (Async Mode)")
+        print("=" * 70)
+        
+        # Step 1: Analyze the input function
+        print("\n📝 Step 1: Analyzing input function...")
+        report(1, "Analyzing input function...")
+        function_info = self.code_analyzer.extract_function_info(function_code)
+        
+        if not function_info['functions']:
+            error_msg = 'No functions found in the provided code'
+            if 'syntax_error' in function_info:
+                error_msg += f". Syntax error: {function_info['syntax_error']}"
+            return {'error': error_msg}
+        
+        print(f"✅ Found {function_info['total_functions']} function(s)")
+        
+        # Step 2: Generate tests using role-based LLM council with CONCURRENT API calls
+        iteration_summary = None
+        if iterative:
+            print(f"\n🎭 Step 2: Consulting Role-Based LLM Council (Coverage-Guided Iterative Mode)...")
+            report(2, "Consulting LLM Council (coverage-guided iterative mode)...")
+            council_results, iteration_summary = await self._generate_tests_iteratively_async(
+                function_code, function_info, max_concurrent=max_concurrent,
+                progress_callback=progress_callback
+            )
+        else:
+            print(f"\n🎭 Step 2: Consulting Role-Based LLM Council (Concurrent Mode)...")
+            report(2, "Consulting LLM Council...")
+            council_results = await self.llm_council.generate_tests_from_council_async(
+                function_info, 
+                max_concurrent=max_concurrent
+            )
+        
+        # Step 3: Classify all test cases
+        print("\n🏷️  Step 3: Classifying test cases by category and role...")
+        report(3, "Classifying test cases...")
+        all_classified_tests = self.test_classifier.classify_council_results(council_results)
+        
+        print(f"✅ Total tests generated: {len(all_classified_tests)}")
+        
+        # Display role distribution
+        role_counts = Counter(test['role_name'] for test in all_classified_tests)
+        print("\n🎭 Role distribution:")
+        for role_name, count in role_counts.items():
+            print(f"   • {role_name}: {count} tests")
+        
+        # Display category distribution
+        category_counts = Counter(test['category'] for test in all_classified_tests)
+        print("\n📊 Category distribution:")
+        for category, count in category_counts.items():
+            print(f"   • {category}: {count} tests")
+        
+        # Display model-role performance matrix
+        print("\n🔬 Model-Role Performance Matrix:")
+        for model_name, role_results in council_results.items():
+            print(f"\n   {model_name}:")
+            for role_id, results in role_results.items():
+                print(f"      └─ {results['role_name']}: {results['test_count']} tests")
+        
+        # Step 4: Hybrid Cluster-then-Synthesize approach
+        print(f"\n🔬 Step 4: Hybrid Cluster-then-Synthesize Deduplication...")
+        report(4, "Synthesizing final test file...")
+        # Synthesis makes blocking LLM calls; keep the event loop free for other pipelines
+        synthesis_results = await asyncio.to_thread(
+            self.test_synthesizer.synthesize_final_test_file,
+            all_classified_tests, function_info, clustering_method=clustering_method
+        )
+        
+        # Step 5: Save results to output directory
+        print(f"\n💾 Step 5: Saving results to {output_dir}/...")
+        report(5, "Saving results...")
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Save source function
+        function_file_path = os.path.join(output_dir, 'function.py')
+        with open(function_file_path, 'w') as f:
+            f.write(function_code)
+        print(f"   ✅ Saved source function to: {function_file_path}")
+        
+        # Save test file
+        test_file_path = os.path.join(output_dir, 'test_function.py')
+        with open(test_file_path, 'w') as f:
+            f.write(synthesis_results['synthesized_content'])
+        print(f"   ✅ Saved test file to: {test_file_path}")
+        
+        # Step 6: Analyze coverage using the saved files
+        # (iterative runs stop on line + branch coverage, so the final figure uses the same mode)
+        coverage_mode = 'line+branch' if iterative else 'line'
+        print(f"\n📊 Step 6: Analyzing code coverage ({coverage_mode})...")
+        report(6, "Analyzing coverage...")
+        coverage_results = await self._analyze_coverage_async(
+            function_code, 
+            synthesis_results['synthesized_content'],
+            output_dir=output_dir,
+            branch=iterative
+        )
+        
+        # Prepare comprehensive results
+        results = {
+            'function_info': function_info,
+            'council_results': council_results,
+            'all_classified_tests': all_classified_tests,
+            'synthesis_results': synthesis_results,
+            'final_test_file': synthesis_results['synthesized_content'],
+            'coverage_results': coverage_results,
+            'output_dir': output_dir,
+            'statistics': {
+                'original_test_count': len(all_classified_tests),
+                'final_test_count': synthesis_results['final_count'],
+                'cluster_count': synthesis_results['cluster_count'],
+                'reduction_ratio': synthesis_results['reduction_ratio'],
+                'clustering_method': clustering_method,
+                'coverage_percentage': coverage_results.get('coverage_percentage', 0.0),
+                'coverage_mode': coverage_mode,
+                'test_success_rate': coverage_results.get('success_rate', 0.0),
+                'total_tests_run': coverage_results.get('total_tests', 0),
+                'passed_tests': coverage_results.get('passed_tests', 0),
+                'failed_tests': coverage_results.get('failed_tests', 0),
+                'skipped_tests': coverage_results.get('skipped_tests', 0),
+                'error_tests': coverage_results.get('error_tests', 0),
+                'models_used': list(council_results.keys()),
+                'roles_used': list(set(test['role_name'] for test in all_classified_tests)),
+                'categories_found': list(category_counts.keys()),
+                'synthesizer_model': synthesis_results['synthesizer_model'],
+                'finalizer_model': synthesis_results.get('finalizer_model', 'fallback'),
+                'selection_tiers': synthesis_results.get('selection_tiers', {}),
+                'tests_per_role': dict(role_counts),
+                'tests_per_category': dict(category_counts),
+                'model_role_matrix': {
+                    model: {role: results['test_count'] for role, results in roles.items()}
+                    for model, roles in council_results.items()
+                }
+            }
+        }
+        
+        if iteration_summary is not None:
+            results['statistics']['iterative_generation'] = iteration_summary
+        
+        # Keep a single copy of each test; raw responses move to the blob store
+        results = FunctionResult.from_results(results, self.test_code_pool, self.raw_response_store)
+        
+        # Save additional metadata
+        self._save_metadata(results, output_dir)
+        
+        print("\n🎉 Pipeline completed successfully!")
+        print(f"📊 Test Success Rate: {coverage_results.get('success_rate', 0.0):.1f}%")
+        print(f"📈 Code Coverage ({coverage_mode}): {coverage_results.get('coverage_percentage', 0.0):.1f}%")
+        print(f"✅ Passed Tests: {coverage_results.get('passed_tests', 0)}/{coverage_results.get('total_tests', 0)}")
+        print(f"📁 Output directory: {output_dir}/")
+        print("=" * 70)
+        
+        return results
+    
+    async def _analyze_coverage_async(self, source_code: str, test_code: str, output_dir: str = None,
+                                      branch: bool = False) -> Dict[str, Any]:
+        """Run CoverageAnalyzer (a pytest subprocess) on the coverage executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.coverage_executor,
+            functools.partial(self.coverage_analyzer.analyze_coverage,
+                              source_code, test_code, output_dir=output_dir, branch=branch)
+        )
+    
+    async def _generate_tests_iteratively_async(self, function_code: str, function_info: Dict[str, Any],
+                                                max_concurrent: int = 7,
+                                                progress_callback: Callable[[int, str], None] = None
+                                                ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Coverage-guided generation: run a cheap first wave, measure coverage of function.py,
+        then dispatch gap-targeted follow-up roles until targets are met or the budget runs out
+        
+        Returns (council_results, iteration_summary)
+        """
+        settings = self.config.ITERATIVE_GENERATION
+        roles = self.llm_council.roles
+        
+        all_pairs = [
+            (model_name, role_id)
+            for model_name, assigned_roles in self.llm_council.model_role_assignments.items()
+            if model_name in self.llm_council.models
+            for role_id in assigned_roles
+            if role_id in roles
+        ]
+        max_llm_calls = settings.get('max_llm_calls') or len(all_pairs)
+        target_coverage = settings['target_coverage']
+        
+        # First wave: one model per cheap role
+        first_wave = []
+        for role_id in settings['first_wave_roles']:
+            pair = next((p for p in all_pairs if p[1] == role_id), None)
+            if pair is not None:
+                first_wave.append(pair)
+        if not first_wave:
+            first_wave = all_pairs[:1]
+        
+        council_results = {}
+        used_pairs = set()
+        coverage_gaps = None
+        llm_calls = 0
+        rounds = []
+        stop_reason = 'max_rounds'
+        
+        for round_index in range(settings['max_rounds'] + 1):
+            if round_index == 0:
+                pairs = first_wave[:max_llm_calls]
+            else:
+                pairs = self._select_followup_pairs(
+                    all_pairs, used_pairs, coverage_gaps['missing_categories'],
+                    min(settings['followups_per_round'], max_llm_calls - llm_calls)
+                )
+            
+            if not pairs:
+                stop_reason = 'no_followups'
+                break
+            
+            wave_name = "first wave" if round_index == 0 else f"follow-up round {round_index}"
+            print(f"\n🌊 Iterative generation - {wave_name}: "
+                  f"{', '.join(f'{model} as {role}' for model, role in pairs)}")
+            if progress_callback is not None:
+                progress_callback(2, f"Iterative generation - {wave_name} ({len(pairs)} LLM call(s))...")
+            
+            round_results = await self.llm_council.generate_tests_from_council_async(
+                function_info,
+                max_concurrent=max_concurrent,
+                model_role_assignments=self._pairs_to_assignments(pairs),
+                coverage_gaps=coverage_gaps
+            )
+            llm_calls += len(pairs)
+            used_pairs.update(pairs)
+            self._merge_council_results(council_results, round_results)
+            
+            classified_tests = self.test_classifier.classify_council_results(council_results)
+            coverage_gaps = await self._measure_coverage_gaps(function_code, function_info, classified_tests)
+            
+            rounds.append({
+                'round': round_index,
+                'model_role_pairs': [list(pair) for pair in pairs],
+                'new_tests': sum(res['test_count'] for roles_res in round_results.values()
+                                 for res in roles_res.values()),
+                'total_tests': len(classified_tests),
+                'coverage_percentage': coverage_gaps['coverage_percentage'],
+                'missing_lines': coverage_gaps['missing_lines'],
+                'missing_branches': [list(branch) for branch in coverage_gaps['missing_branches']],
+                'missing_categories': coverage_gaps['missing_categories']
+            })
+            
+            print(f"   📈 Coverage after {wave_name}: {coverage_gaps['coverage_percentage']:.1f}% "
+                  f"(target {target_coverage:.1f}%) | "
+                  f"Missing lines: {len(coverage_gaps['missing_lines'])} | "
+                  f"Missing branches: {len(coverage_gaps['missing_branches'])} | "
+                  f"Missing categories: {', '.join(coverage_gaps['missing_categories']) or 'none'}")
+            
+            if (coverage_gaps['coverage_percentage'] >= target_coverage
+                    and not coverage_gaps['missing_categories']):
+                stop_reason = 'targets_met'
+                break
+            
+            if llm_calls >= max_llm_calls:
+                stop_reason = 'budget_exhausted'
+                break
+        
+        print(f"\n🛑 Iterative generation stopped ({stop_reason}): "
+              f"{llm_calls} LLM call(s) vs {len(all_pairs)} for a full council run")
+        
+        iteration_summary = {
+            'stop_reason': stop_reason,
+            'llm_calls': llm_calls,
+            'max_llm_calls': max_llm_calls,
+            'full_council_calls': len(all_pairs),
+            'coverage_mode': 'line+branch',
+            'target_coverage': target_coverage,
+            'final_coverage': coverage_gaps['coverage_percentage'] if coverage_gaps else 0.0,
+            'rounds': rounds
+        }
+        return council_results, iteration_summary
+    
+    def _select_followup_pairs(self, all_pairs: List[Tuple[str, str]], used_pairs: set,
+                               missing_categories: List[str], limit: int) -> List[Tuple[str, str]]:
+        """Pick follow-up model-role pairs: unused pairs first, then roles focused on missing categories"""
+        if limit <= 0:
+            return []
+        
+        def priority(pair):
+            focus = set(self.llm_council.roles[pair[1]]['focus_categories'])
+            return (pair in used_pairs, -len(focus & set(missing_categories)))
+        
+        return sorted(all_pairs, key=priority)[:limit]
+    
+    @staticmethod
+    def _pairs_to_assignments(pairs: List[Tuple[str, str]]) -> Dict[str, List[str]]:
+        """Convert (model, role) pairs into the MODEL_ROLE_ASSIGNMENTS format"""
+        assignments = {}
+        for model_name, role_id in pairs:
+            assignments.setdefault(model_name, []).append(role_id)
+        return assignments
+    
+    @staticmethod
+    def _merge_council_results(council_results: Dict[str, Any], round_results: Dict[str, Any]):
+        """Merge one generation round into the accumulated council results (in place)"""
+        for model_name, role_results in round_results.items():
+            model_results = council_results.setdefault(model_name, {})
+            for role_id, results in role_results.items():
+                if role_id not in model_results:
+                    model_results[role_id] = results
+                    continue
+                
+                existing = model_results[role_id]
+                existing['raw_response'] = '\n\n'.join(
+                    r for r in [existing['raw_response'], results['raw_response']] if r
+                )
+                existing['test_methods'] = existing['test_methods'] + results['test_methods']
+                existing['test_count'] = len(existing['test_methods'])
+    
+    async def _measure_coverage_gaps(self, function_code: str, function_info: Dict[str, Any],
+                                     classified_tests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Run the raw tests generated so far and report uncovered lines, branches and categories"""
+        probe_test_code = self._build_probe_test_file(classified_tests, function_info)
+        
+        coverage_results = await self._analyze_coverage_async(function_code, probe_test_code, branch=True)
+        
+        coverage_gaps = self.coverage_analyzer.extract_coverage_gaps(
+            coverage_results.get('coverage_data', {}), function_code
+        )
+        coverage_gaps['coverage_percentage'] = coverage_results.get('coverage_percentage', 0.0)
+        
+        categories_found = {test['category'] for test in classified_tests}
+        coverage_gaps['missing_categories'] = [
+            category for category in self.config.ITERATIVE_GENERATION['required_categories']
+            if category not in categories_found
+        ]
+        coverage_gaps['existing_test_names'] = [test['name'] for test in classified_tests]
+        return coverage_gaps
+    
+    def _build_probe_test_file(self, classified_tests: List[Dict[str, Any]], function_info: Dict[str, Any]) -> str:
+        """Assemble raw (unsynthesized) tests into a runnable file for coverage measurement"""
+        function_names = [f['name'] for f in function_info.get('functions', [])]
+        test_code = f"import pytest\nfrom function import {', '.join(function_names)}\n\n\n"
+        
+        name_counts = Counter()
+        for test in classified_tests:
+            # A single unparsable test would break collection of the whole file
+            code = self.test_synthesizer._clean_synthesized_content(test['code'])
+            try:
+                ast.parse(code)
+            except SyntaxError:
+                continue
+            
+            # Tests from different roles often share names; keep all of them collectable
+            name_counts[test['name']] += 1
+            if name_counts[test['name']] > 1:
+                code = code.replace(f"def {test['name']}(",
+                                    f"def {test['name']}_{name_counts[test['name']]}(", 1)
+            test_code += code + "\n\n\n"
+        
+        return test_code
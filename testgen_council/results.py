@@ -0,0 +1,400 @@
+"""Compact result model and out-of-line raw response store."""
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import weakref
+import zlib
+from typing import Any, Dict
+
+
+def _content_hash(text: str) -> str:
+    """Content hash used to reference tests and raw responses"""
+    return sys.intern(hashlib.md5(text.encode('utf-8')).hexdigest())
+
+def _intern(value):
+    """Intern short repeated strings (model, role, category names); leave other values untouched"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class RawResponseStore:
+    """
+    Content-addressed blob store for raw LLM responses and other bulky text.
+    Blobs are written zlib-compressed to disk once and read back lazily on access.
+    """
+
+    def __init__(self, root_dir: str = None):
+        # Absolute, so results.json can be loaded from any working directory
+        self.root_dir = os.path.abspath(root_dir or tempfile.mkdtemp(prefix='testgen_blobs_'))
+        os.makedirs(self.root_dir, exist_ok=True)
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.root_dir, digest[:2], digest)
+
+    def put(self, text: str) -> str:
+        """Store text (if not already present) and return its content hash"""
+        if not text:
+            return ''
+        digest = _content_hash(text)
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp{os.getpid()}"
+            with open(tmp_path, 'wb') as f:
+                f.write(zlib.compress(text.encode('utf-8')))
+            os.replace(tmp_path, path)
+        return digest
+
+    def get(self, digest: str) -> str:
+        """Load a blob by content hash ('' for empty or missing blobs)"""
+        if not digest:
+            return ''
+        try:
+            with open(self._blob_path(digest), 'rb') as f:
+                return zlib.decompress(f.read()).decode('utf-8')
+        except FileNotFoundError:
+            print(f"⚠️  Raw response blob {digest} not found in {self.root_dir}")
+            return ''
+
+
+class TestCodePool:
+    """
+    Holds each distinct test code string once; results reference tests by content hash.
+    Codes are reference-counted per FunctionResult and dropped when the last result
+    referencing them is garbage collected, so long-running processes do not accumulate tests.
+    """
+
+    __slots__ = ('_codes', '_refs')
+
+    def __init__(self):
+        self._codes = {}
+        self._refs = {}
+
+    def add(self, code: str) -> str:
+        digest = _content_hash(code)
+        if digest not in self._codes:
+            self._codes[digest] = code
+        return digest
+
+    def get(self, digest: str) -> str:
+        return self._codes.get(digest, '')
+
+    def acquire(self, digests):
+        """Count one more holder for each digest"""
+        for digest in digests:
+            self._refs[digest] = self._refs.get(digest, 0) + 1
+
+    def release(self, digests):
+        """Drop one holder for each digest; codes without holders are removed"""
+        for digest in digests:
+            count = self._refs.get(digest, 0) - 1
+            if count > 0:
+                self._refs[digest] = count
+            else:
+                self._refs.pop(digest, None)
+                self._codes.pop(digest, None)
+
+    def __len__(self):
+        return len(self._codes)
+
+
+class TestRecord:
+    """A single test referenced by content hash, with interned metadata"""
+
+    __slots__ = ('code_hash', 'name', 'category', 'source_model', 'source_role', 'role_name',
+                 'cluster_id', 'cluster_size')
+
+    def __init__(self, code_hash: str, name: str, category: str, source_model: str = 'unknown',
+                 source_role: str = None, role_name: str = None,
+                 cluster_id: int = -1, cluster_size: int = 1):
+        self.code_hash = code_hash
+        self.name = _intern(name)
+        self.category = _intern(category)
+        self.source_model = _intern(source_model)
+        self.source_role = _intern(source_role)
+        self.role_name = _intern(role_name)
+        self.cluster_id = int(cluster_id)
+        self.cluster_size = int(cluster_size)
+
+    def to_row(self) -> list:
+        return [self.code_hash, self.name, self.category, self.source_model, self.source_role,
+                self.role_name, self.cluster_id, self.cluster_size]
+
+    @classmethod
+    def from_row(cls, row: list) -> 'TestRecord':
+        return cls(*row)
+
+
+class CouncilRun:
+    """One model-role generation call; the raw response lives in the blob store"""
+
+    __slots__ = ('model_name', 'role_id', 'role_name', 'focus_categories', 'raw_response_hash',
+                 'test_hashes', 'test_names')
+
+    def __init__(self, model_name: str, role_id: str, role_name: str, focus_categories,
+                 raw_response_hash: str, test_hashes, test_names):
+        self.model_name = _intern(model_name)
+        self.role_id = _intern(role_id)
+        self.role_name = _intern(role_name)
+        self.focus_categories = tuple(_intern(c) for c in focus_categories)
+        self.raw_response_hash = raw_response_hash
+        self.test_hashes = tuple(test_hashes)
+        self.test_names = tuple(_intern(n) for n in test_names)
+
+    @property
+    def test_count(self) -> int:
+        return len(self.test_hashes)
+
+    def to_row(self) -> list:
+        return [self.model_name, self.role_id, self.role_name, list(self.focus_categories),
+                self.raw_response_hash, list(self.test_hashes), list(self.test_names)]
+
+    @classmethod
+    def from_row(cls, row: list) -> 'CouncilRun':
+        return cls(*row)
+
+
+class FunctionResult:
+    """
+    Compact pipeline result for one function.
+
+    Tests are stored once in a shared TestCodePool and referenced by content hash;
+    raw LLM responses, pytest output and the final test file live in a RawResponseStore
+    and are only read when accessed. Dict-style access (results['statistics'], 'error' in results, ...)
+    rebuilds the legacy result layout on demand for existing callers.
+    """
+
+    COMPACT_FORMAT = 'testgen-council/compact-v2'
+    # v1 kept final_test_file inline; it is moved into the blob store on load
+    _LEGACY_COMPACT_FORMATS = ('testgen-council/compact-v1',)
+
+    __slots__ = ('function_info', 'output_dir', 'council_runs', 'classified_tests', 'final_tests',
+                 'clusters', 'final_test_file_hash', 'synthesis_info', 'coverage', 'statistics',
+                 '_code_pool', '_blob_store', '__weakref__')
+
+    _LEGACY_KEYS = ('function_info', 'council_results', 'all_classified_tests', 'synthesis_results',
+                    'final_test_file', 'coverage_results', 'output_dir', 'statistics')
+
+    # Bulky coverage fields moved out of line into the blob store
+    _COVERAGE_BLOB_FIELDS = ('test_results', 'test_stderr')
+
+    def __init__(self, function_info: Dict[str, Any], output_dir: str, council_runs, classified_tests,
+                 final_tests, clusters, final_test_file_hash: str, synthesis_info: Dict[str, Any],
+                 coverage: Dict[str, Any], statistics: Dict[str, Any],
+                 code_pool: TestCodePool, blob_store: RawResponseStore):
+        self.function_info = function_info
+        self.output_dir = output_dir
+        self.council_runs = tuple(council_runs)
+        self.classified_tests = tuple(classified_tests)
+        self.final_tests = tuple(final_tests)
+        self.clusters = tuple(tuple(int(i) for i in indices) for indices in clusters)
+        self.final_test_file_hash = final_test_file_hash
+        self.synthesis_info = synthesis_info
+        self.coverage = coverage
+        self.statistics = statistics
+        self._code_pool = code_pool
+        self._blob_store = blob_store
+
+        # Keep this result's tests in the shared pool only as long as the result is alive
+        referenced = self._referenced_hashes()
+        code_pool.acquire(referenced)
+        weakref.finalize(self, code_pool.release, referenced)
+
+    @classmethod
+    def from_results(cls, results: Dict[str, Any], code_pool: TestCodePool,
+                     blob_store: RawResponseStore) -> 'FunctionResult':
+        """Compact a legacy pipeline results dict"""
+        council_runs = []
+        for model_name, role_results in results['council_results'].items():
+            for role_id, role_result in role_results.items():
+                council_runs.append(CouncilRun(
+                    model_name, role_id, role_result['role_name'], role_result['focus_categories'],
+                    blob_store.put(role_result['raw_response']),
+                    [code_pool.add(t['code']) for t in role_result['test_methods']],
+                    [t['name'] for t in role_result['test_methods']]
+                ))
+
+        classified_tests = [
+            TestRecord(code_pool.add(t['code']), t['name'], t['category'], t['source_model'],
+                       t.get('source_role'), t.get('role_name'))
+            for t in results['all_classified_tests']
+        ]
+
+        synthesis_results = results['synthesis_results']
+        final_tests = [
+            TestRecord(code_pool.add(t['code']), t['name'], t['category'], t.get('source', 'unknown'),
+                       cluster_id=t.get('cluster_id', -1), cluster_size=t.get('cluster_size', 1))
+            for t in synthesis_results['final_tests']
+        ]
+        clusters = [synthesis_results['clusters'][k] for k in sorted(synthesis_results.get('clusters', {}))]
+        synthesis_info = {
+            key: _intern(value) if isinstance(value, str) else value
+            for key, value in synthesis_results.items()
+            if key not in ('synthesized_content', 'final_tests', 'clusters')
+        }
+
+        coverage = {}
+        for key, value in results['coverage_results'].items():
+            if key in cls._COVERAGE_BLOB_FIELDS:
+                coverage[f'{key}_hash'] = blob_store.put(value)
+            elif key == 'coverage_data':
+                coverage['coverage_data_hash'] = blob_store.put(json.dumps(value)) if value else ''
+            else:
+                coverage[key] = value
+
+        return cls(results['function_info'], results['output_dir'], council_runs, classified_tests,
+                   final_tests, clusters, blob_store.put(results['final_test_file']), synthesis_info, coverage,
+                   results['statistics'], code_pool, blob_store)
+
+    def _referenced_hashes(self) -> frozenset:
+        referenced = {t.code_hash for t in self.classified_tests}
+        referenced.update(t.code_hash for t in self.final_tests)
+        for run in self.council_runs:
+            referenced.update(run.test_hashes)
+        return frozenset(referenced)
+
+    # --- Lazy access to out-of-line data ---
+
+    def test_code(self, record: TestRecord) -> str:
+        return self._code_pool.get(record.code_hash)
+
+    def raw_response(self, run: CouncilRun) -> str:
+        """Load a raw LLM response from the blob store"""
+        return self._blob_store.get(run.raw_response_hash)
+
+    @property
+    def final_test_file(self) -> str:
+        """Load the synthesized test file from the blob store"""
+        return self._blob_store.get(self.final_test_file_hash)
+
+    # --- Legacy dict view ---
+
+    def _test_dict(self, record: TestRecord) -> Dict[str, Any]:
+        return {
+            'name': record.name,
+            'code': self.test_code(record),
+            'category': record.category,
+            'source_model': record.source_model,
+            'source_role': record.source_role,
+            'role_name': record.role_name
+        }
+
+    def _legacy_council_results(self) -> Dict[str, Any]:
+        council_results = {}
+        for run in self.council_runs:
+            council_results.setdefault(run.model_name, {})[run.role_id] = {
+                'role_name': run.role_name,
+                'raw_response': self.raw_response(run),
+                'test_methods': [{'name': name, 'code': self._code_pool.get(code_hash)}
+                                 for code_hash, name in zip(run.test_hashes, run.test_names)],
+                'test_count': run.test_count,
+                'focus_categories': list(run.focus_categories)
+            }
+        return council_results
+
+    def _legacy_synthesis_results(self) -> Dict[str, Any]:
+        synthesis_results = dict(self.synthesis_info)
+        synthesis_results['synthesized_content'] = self.final_test_file
+        synthesis_results['final_tests'] = [
+            {
+                'name': t.name,
+                'code': self.test_code(t),
+                'category': t.category,
+                'source': t.source_model,
+                'cluster_id': t.cluster_id,
+                'cluster_size': t.cluster_size,
+                'is_synthesized': t.cluster_size > 1
+            }
+            for t in self.final_tests
+        ]
+        synthesis_results['clusters'] = {i: list(indices) for i, indices in enumerate(self.clusters)}
+        return synthesis_results
+
+    def _legacy_coverage_results(self) -> Dict[str, Any]:
+        coverage_results = {}
+        for key, value in self.coverage.items():
+            if key == 'coverage_data_hash':
+                coverage_results['coverage_data'] = json.loads(self._blob_store.get(value) or '{}')
+            elif key.endswith('_hash') and key[:-len('_hash')] in self._COVERAGE_BLOB_FIELDS:
+                coverage_results[key[:-len('_hash')]] = self._blob_store.get(value)
+            else:
+                coverage_results[key] = value
+        return coverage_results
+
+    def __getitem__(self, key: str):
+        if key == 'council_results':
+            return self._legacy_council_results()
+        if key == 'all_classified_tests':
+            return [self._test_dict(t) for t in self.classified_tests]
+        if key == 'synthesis_results':
+            return self._legacy_synthesis_results()
+        if key == 'coverage_results':
+            return self._legacy_coverage_results()
+        if key in self._LEGACY_KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self else default
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._LEGACY_KEYS
+
+    def keys(self):
+        return list(self._LEGACY_KEYS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the full legacy results dict (loads all blobs)"""
+        return {key: self[key] for key in self._LEGACY_KEYS}
+
+    # --- Compact serialization ---
+
+    def to_compact_dict(self) -> Dict[str, Any]:
+        """Serializable form: each test code stored once, raw responses referenced by hash"""
+        referenced = self._referenced_hashes()
+
+        return {
+            'format': self.COMPACT_FORMAT,
+            'blob_store': self._blob_store.root_dir,
+            'output_dir': self.output_dir,
+            'function_info': self.function_info,
+            'tests': {h: self._code_pool.get(h) for h in sorted(referenced)},
+            'council_runs': [run.to_row() for run in self.council_runs],
+            'classified_tests': [t.to_row() for t in self.classified_tests],
+            'final_tests': [t.to_row() for t in self.final_tests],
+            'clusters': [list(indices) for indices in self.clusters],
+            'final_test_file_hash': self.final_test_file_hash,
+            'synthesis_info': self.synthesis_info,
+            'coverage': self.coverage,
+            'statistics': self.statistics
+        }
+
+    @classmethod
+    def from_compact_dict(cls, data: Dict[str, Any], code_pool: TestCodePool = None,
+                          blob_store: RawResponseStore = None) -> 'FunctionResult':
+        """Load a result written by to_compact_dict (raw responses stay on disk until accessed)"""
+        if data.get('format') != cls.COMPACT_FORMAT and data.get('format') not in cls._LEGACY_COMPACT_FORMATS:
+            raise ValueError(f"Unsupported result format: {data.get('format')}")
+
+        code_pool = code_pool if code_pool is not None else TestCodePool()
+        blob_store = blob_store or RawResponseStore(data['blob_store'])
+        for code in data['tests'].values():
+            code_pool.add(code)
+        if 'final_test_file_hash' in data:
+            final_test_file_hash = data['final_test_file_hash']
+        else:
+            final_test_file_hash = blob_store.put(data['final_test_file'])
+
+        return cls(data['function_info'], data['output_dir'],
+                   [CouncilRun.from_row(row) for row in data['council_runs']],
+                   [TestRecord.from_row(row) for row in data['classified_tests']],
+                   [TestRecord.from_row(row) for row in data['final_tests']],
+                   data['clusters'], final_test_file_hash, data['synthesis_info'],
+                   data['coverage'], data['statistics'], code_pool, blob_store)
+
+    @classmethod
+    def load(cls, path: str, code_pool: TestCodePool = None,
+             blob_store: RawResponseStore = None) -> 'FunctionResult':
+        with open(path, 'r') as f:
+            return cls.from_compact_dict(json.load(f), code_pool, blob_store)
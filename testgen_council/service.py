@@ -0,0 +1,362 @@
+"""Local test-generation service: persistent job queue, worker pools and SSE progress."""
+import ast
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from aiohttp import web
+
+from .config import Config
+from .pipeline import AsyncIntelligentTestCouncil
+
+
+def function_fingerprint(function_code: str, options: Dict[str, Any]) -> str:
+    """
+    Fingerprint a submission so identical requests share one pipeline run.
+    Formatting and comments are ignored by hashing the parsed AST when possible.
+    """
+    code = function_code.strip()
+    try:
+        normalized = ast.dump(ast.parse(code), annotate_fields=False)
+    except SyntaxError:
+        normalized = code
+    payload = json.dumps({'code': normalized, 'options': options}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class JobStore:
+    """Persistent job queue backed by SQLite (survives service restarts)"""
+
+    TERMINAL_STATUSES = ('completed', 'failed')
+
+    def __init__(self, db_path: str):
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        # Only accessed from the service event loop thread
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                status TEXT NOT NULL,
+                function_code TEXT NOT NULL,
+                options TEXT NOT NULL,
+                output_dir TEXT NOT NULL,
+                statistics TEXT,
+                error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_fingerprint ON jobs (fingerprint)")
+        self.conn.commit()
+
+    @staticmethod
+    def _to_dict(row) -> Dict[str, Any]:
+        if row is None:
+            return None
+        job = dict(row)
+        job['options'] = json.loads(job['options'])
+        job['statistics'] = json.loads(job['statistics']) if job['statistics'] else None
+        return job
+
+    def create(self, job_id: str, fingerprint: str, function_code: str, options: Dict[str, Any],
+               output_dir: str) -> Dict[str, Any]:
+        now = datetime.now().isoformat()
+        self.conn.execute(
+            "INSERT INTO jobs (job_id, fingerprint, status, function_code, options, output_dir, "
+            "created_at, updated_at) VALUES (?, ?, 'queued', ?, ?, ?, ?, ?)",
+            (job_id, fingerprint, function_code, json.dumps(options), output_dir, now, now)
+        )
+        self.conn.commit()
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Dict[str, Any]:
+        row = self.conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._to_dict(row)
+
+    def find_reusable(self, fingerprint: str) -> Dict[str, Any]:
+        """Latest queued, running or completed job with this fingerprint"""
+        row = self.conn.execute(
+            "SELECT * FROM jobs WHERE fingerprint = ? AND status != 'failed' "
+            "ORDER BY created_at DESC LIMIT 1", (fingerprint,)
+        ).fetchone()
+        return self._to_dict(row)
+
+    def update(self, job_id: str, **fields):
+        if 'statistics' in fields and fields['statistics'] is not None:
+            fields['statistics'] = json.dumps(fields['statistics'])
+        fields['updated_at'] = datetime.now().isoformat()
+        assignments = ', '.join(f"{key} = ?" for key in fields)
+        self.conn.execute(f"UPDATE jobs SET {assignments} WHERE job_id = ?",
+                          (*fields.values(), job_id))
+        self.conn.commit()
+
+    def unfinished(self) -> List[Dict[str, Any]]:
+        """Jobs that were queued or running when the service last stopped"""
+        rows = self.conn.execute(
+            "SELECT * FROM jobs WHERE status IN ('queued', 'running') ORDER BY created_at"
+        ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+
+class TestGenerationService:
+    """
+    Local HTTP service wrapping AsyncIntelligentTestCouncil.
+
+    Jobs are persisted in SQLite, deduplicated by function fingerprint and executed by a
+    bounded pool of pipeline workers; pytest/coverage runs use a separate bounded pool.
+    Progress is streamed to clients as Server-Sent Events.
+
+    Endpoints:
+        POST /jobs                  {"function_code", "clustering_method", "iterative", "force"}
+        GET  /jobs/{job_id}         job status (and statistics once completed)
+        GET  /jobs/{job_id}/events  progress stream (text/event-stream)
+        GET  /jobs/{job_id}/result  compact FunctionResult serialization (with final_test_file inlined)
+        GET  /health
+    """
+
+    def __init__(self, config: Config, data_dir: str = None, pipeline_workers: int = None,
+                 coverage_workers: int = None, max_concurrent: int = None):
+        settings = config.SERVICE
+        self.data_dir = os.path.abspath(data_dir or settings['data_dir'])
+        self.pipeline_workers = pipeline_workers or settings['pipeline_workers']
+        self.coverage_workers = coverage_workers or settings['coverage_workers']
+        self.max_concurrent = max_concurrent or settings['max_concurrent_llm_calls']
+
+        self.coverage_executor = ThreadPoolExecutor(max_workers=self.coverage_workers,
+                                                    thread_name_prefix='coverage')
+        self.council = AsyncIntelligentTestCouncil(config, coverage_executor=self.coverage_executor)
+        self.jobs = JobStore(os.path.join(self.data_dir, 'jobs.sqlite3'))
+
+        self.queue = None
+        self.workers = []
+        self.events = {}        # job_id -> events published so far (replayed to late subscribers)
+        self.subscribers = {}   # job_id -> set of per-client asyncio.Queue
+
+    # --- Job lifecycle ---
+
+    async def start(self):
+        """Start the pipeline worker pool and re-enqueue unfinished jobs"""
+        self.queue = asyncio.Queue()
+        for job in self.jobs.unfinished():
+            self.jobs.update(job['job_id'], status='queued')
+            self.queue.put_nowait(job['job_id'])
+            print(f"🔁 Re-queued unfinished job {job['job_id']}")
+
+        self.workers = [asyncio.create_task(self._worker(i)) for i in range(self.pipeline_workers)]
+        print(f"✅ Test generation service started: {self.pipeline_workers} pipeline worker(s), "
+              f"{self.coverage_workers} coverage worker(s)")
+
+    async def stop(self):
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.coverage_executor.shutdown(wait=False)
+
+    def submit(self, function_code: str, clustering_method: str = 'vector', iterative: bool = False,
+               force: bool = False) -> Tuple[Dict[str, Any], bool]:
+        """Enqueue a job, or return the existing job for an identical submission"""
+        options = {'clustering_method': clustering_method, 'iterative': bool(iterative)}
+        fingerprint = function_fingerprint(function_code, options)
+
+        if not force:
+            existing = self.jobs.find_reusable(fingerprint)
+            if existing is not None:
+                return existing, True
+
+        job_id = uuid.uuid4().hex
+        output_dir = os.path.join(self.data_dir, 'results', job_id)
+        job = self.jobs.create(job_id, fingerprint, function_code, options, output_dir)
+        self._publish(job['job_id'], {'type': 'status', 'status': 'queued'})
+        self.queue.put_nowait(job['job_id'])
+        return job, False
+
+    async def _worker(self, worker_id: int):
+        while True:
+            job_id = await self.queue.get()
+            try:
+                await self._run_job(job_id)
+            except Exception as e:
+                print(f"❌ Worker {worker_id} failed on job {job_id}: {e}")
+                self.jobs.update(job_id, status='failed', error=str(e))
+                self._publish(job_id, {'type': 'failed', 'status': 'failed', 'error': str(e)})
+            finally:
+                self.queue.task_done()
+
+    async def _run_job(self, job_id: str):
+        job = self.jobs.get(job_id)
+        self.jobs.update(job_id, status='running')
+        self._publish(job_id, {'type': 'status', 'status': 'running'})
+
+        def on_progress(step: int, message: str):
+            self._publish(job_id, {'type': 'progress', 'step': step,
+                                   'total_steps': AsyncIntelligentTestCouncil.PIPELINE_STEPS,
+                                   'message': message})
+
+        results = await self.council.generate_comprehensive_tests_async(
+            job['function_code'],
+            max_concurrent=self.max_concurrent,
+            clustering_method=job['options']['clustering_method'],
+            output_dir=job['output_dir'],
+            iterative=job['options']['iterative'],
+            progress_callback=on_progress
+        )
+
+        if 'error' in results:
+            self.jobs.update(job_id, status='failed', error=results['error'])
+            self._publish(job_id, {'type': 'failed', 'status': 'failed', 'error': results['error']})
+            return
+
+        self.jobs.update(job_id, status='completed', statistics=results.statistics)
+        self._publish(job_id, {'type': 'completed', 'status': 'completed'})
+
+    # --- Progress events ---
+
+    def _publish(self, job_id: str, event: Dict[str, Any]):
+        event = dict(event, job_id=job_id)
+        self.events.setdefault(job_id, []).append(event)
+        for subscriber in self.subscribers.get(job_id, ()):
+            subscriber.put_nowait(event)
+        if event['type'] in JobStore.TERMINAL_STATUSES:
+            # Terminal state is persisted; late subscribers get it from the job row
+            self.events.pop(job_id, None)
+
+    @staticmethod
+    async def _send_event(response: web.StreamResponse, event: Dict[str, Any]):
+        await response.write(f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode('utf-8'))
+
+    # --- HTTP API ---
+
+    @staticmethod
+    def _public_job(job: Dict[str, Any], deduplicated: bool = None) -> Dict[str, Any]:
+        public = {key: job[key] for key in ('job_id', 'status', 'options', 'output_dir',
+                                            'statistics', 'error', 'created_at', 'updated_at')}
+        if deduplicated is not None:
+            public['deduplicated'] = deduplicated
+        return public
+
+    def _get_job_or_404(self, request: web.Request) -> Dict[str, Any]:
+        job = self.jobs.get(request.match_info['job_id'])
+        if job is None:
+            raise web.HTTPNotFound(text=json.dumps({'error': 'Unknown job'}),
+                                   content_type='application/json')
+        return job
+
+    async def handle_submit(self, request: web.Request) -> web.Response:
+        try:
+            payload = await request.json()
+        except json.JSONDecodeError:
+            return web.json_response({'error': 'Request body must be JSON'}, status=400)
+        if not isinstance(payload, dict):
+            return web.json_response({'error': 'Request body must be a JSON object'}, status=400)
+
+        function_code = payload.get('function_code') or ''
+        if not isinstance(function_code, str) or not function_code.strip():
+            return web.json_response({'error': "'function_code' is required"}, status=400)
+
+        clustering_method = payload.get('clustering_method', 'vector')
+        if clustering_method not in ('hash', 'vector'):
+            return web.json_response({'error': f"Unknown clustering method: {clustering_method}"},
+                                     status=400)
+
+        # Options are part of the dedup fingerprint, so "false" must not become True
+        for flag in ('iterative', 'force'):
+            if not isinstance(payload.get(flag, False), bool):
+                return web.json_response({'error': f"'{flag}' must be a boolean"}, status=400)
+
+        job, deduplicated = self.submit(function_code.strip(), clustering_method,
+                                        payload.get('iterative', False), payload.get('force', False))
+        return web.json_response(self._public_job(job, deduplicated),
+                                 status=200 if deduplicated else 202)
+
+    async def handle_status(self, request: web.Request) -> web.Response:
+        return web.json_response(self._public_job(self._get_job_or_404(request)))
+
+    async def handle_result(self, request: web.Request) -> web.Response:
+        job = self._get_job_or_404(request)
+        if job['status'] != 'completed':
+            return web.json_response({'error': f"Job is {job['status']}"}, status=409)
+
+        # results.json only references the test file by hash; clients get it inline
+        with open(os.path.join(job['output_dir'], 'results.json'), 'r') as f:
+            result = json.load(f)
+        with open(os.path.join(job['output_dir'], 'test_function.py'), 'r') as f:
+            result['final_test_file'] = f.read()
+        return web.json_response(result)
+
+    async def handle_events(self, request: web.Request) -> web.StreamResponse:
+        job = self._get_job_or_404(request)
+        job_id = job['job_id']
+
+        response = web.StreamResponse(headers={'Content-Type': 'text/event-stream',
+                                               'Cache-Control': 'no-cache'})
+        await response.prepare(request)
+
+        if job['status'] in JobStore.TERMINAL_STATUSES:
+            await self._send_event(response, {'type': job['status'], 'status': job['status'],
+                                              'job_id': job_id, 'error': job['error']})
+            return response
+
+        # Snapshot history and subscribe without yielding, so no event is missed or duplicated
+        subscriber = asyncio.Queue()
+        history = list(self.events.get(job_id, []))
+        self.subscribers.setdefault(job_id, set()).add(subscriber)
+        try:
+            for event in history:
+                await self._send_event(response, event)
+            while True:
+                event = await subscriber.get()
+                await self._send_event(response, event)
+                if event['type'] in JobStore.TERMINAL_STATUSES:
+                    break
+        finally:
+            self.subscribers[job_id].discard(subscriber)
+        return response
+
+    async def handle_health(self, request: web.Request) -> web.Response:
+        return web.json_response({'status': 'ok', 'queued_jobs': self.queue.qsize()})
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post('/jobs', self.handle_submit)
+        app.router.add_get('/jobs/{job_id}', self.handle_status)
+        app.router.add_get('/jobs/{job_id}/events', self.handle_events)
+        app.router.add_get('/jobs/{job_id}/result', self.handle_result)
+        app.router.add_get('/health', self.handle_health)
+        app.on_startup.append(lambda app: self.start())
+        app.on_cleanup.append(lambda app: self.stop())
+        return app
+
+
+def start_service_in_background(service: TestGenerationService, host: str = None,
+                                port: int = None) -> threading.Thread:
+    """
+    Serve on a dedicated thread and event loop, so this kernel stays responsive
+    and other kernels (e.g. InteractiveTestGUI) can use the service over HTTP.
+    """
+    host = host or Config.SERVICE['host']
+    port = port or Config.SERVICE['port']
+    started = threading.Event()
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        runner = web.AppRunner(service.create_app())
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.TCPSite(runner, host, port).start())
+        print(f"🌐 Test generation service listening on http://{host}:{port}")
+        started.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=serve, name='testgen-service', daemon=True)
+    thread.start()
+    started.wait(timeout=30)
+    return thread
@@ -0,0 +1,677 @@
+"""Hybrid Cluster-then-Synthesize test file generation."""
+import ast
+import functools
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from collections import Counter
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Tuple
+
+from tqdm import tqdm
+
+from .analyzer import CodeAnalyzer
+from .clustering import ASTClusterer
+from .config import SYNTHESIZER_MODEL
+from .council import LLMCouncil
+
+
+class TestSynthesizer:
+    """
+    Synthesizes final optimized test file using hybrid Cluster-then-Synthesize approach
+    Combines AST-based structural clustering with LLM-powered semantic synthesis
+    """
+    
+    def __init__(self, llm_council: LLMCouncil, executor: Executor = None):
+        """
+        Args:
+            llm_council: Council used for cluster synthesis and final file generation
+            executor: Optional executor for the quick pytest run (the pipeline's bounded
+                coverage executor); runs in the calling thread when not given
+        """
+        self.llm_council = llm_council
+        self.clusterer = ASTClusterer()
+        self.finalizer_model = "gemini-2.0-flash"
+        self.executor = executor
+    
+    def synthesize_final_test_file(self, all_tests: List[Dict], function_info: Dict,
+                                   clustering_method: str = 'vector') -> Dict[str, Any]:
+        """
+        Synthesize final test file using Cluster-then-Synthesize approach
+        
+        Args:
+            all_tests: List of all generated tests
+            function_info: Information about the function under test
+            clustering_method: 'hash' for fast structural hashing, 'vector' for advanced clustering
+        """
+        print("🔬 Starting Hybrid Cluster-then-Synthesize Pipeline")
+        print("=" * 70)
+        
+        # Stage 1: AST-Based Structural Clustering
+        print("\n📊 Stage 1: AST-Based Structural Clustering")
+        clusters = self.clusterer.cluster_tests(all_tests, method=clustering_method)
+        
+        # Stage 2: Cluster Representative Selection (local scoring, LLM only on disagreement)
+        print(f"\n🤖 Stage 2: Cluster Representative Selection")
+        print(f"   Selecting representatives for {len(clusters)} clusters...")
+        
+        synthesized_tests = []
+        func = function_info['functions'][0] if function_info['functions'] else {}
+        function_name = func.get('name', 'unknown_function')
+        
+        # Select best model for synthesis
+        best_model = SYNTHESIZER_MODEL if SYNTHESIZER_MODEL in self.llm_council.models else list(self.llm_council.models.keys())[0]
+        model_config = self.llm_council.models[best_model]
+        
+        selection = self.llm_council.config.LOCAL_SELECTION
+        selection_tiers = {'singleton': 0, 'local': 0, 'llm': 0}
+        llm_synthesis_reasons = Counter()
+        
+        # One quick pytest run over every multi-test cluster member
+        outcomes = {}
+        if selection['enabled'] and selection['quick_execution']:
+            member_indices = [idx for indices in clusters.values() if len(indices) > 1 for idx in indices]
+            outcomes = self._quick_execute_tests(all_tests, member_indices, function_info,
+                                                 timeout=selection['quick_execution_timeout'])
+        
+        with tqdm(total=len(clusters), desc="Synthesizing clusters") as pbar:
+            for cluster_id, test_indices in clusters.items():
+                cluster_tests = [all_tests[idx] for idx in test_indices]
+                cluster_outcomes = [outcomes.get(idx) for idx in test_indices]
+                
+                if len(cluster_tests) == 1:
+                    # Singleton cluster - use test as-is (already unique)
+                    synthesized_tests.append(cluster_tests[0])
+                    selection_tiers['singleton'] += 1
+                    pbar.update(1)
+                    continue
+                
+                disagreement = self._cluster_disagreement(cluster_tests, cluster_outcomes, function_info)
+                if selection['enabled'] and disagreement is None:
+                    # Members agree on behaviour and outcome - pick the best one locally
+                    synthesized_tests.append(
+                        self._select_cluster_representative(cluster_tests, cluster_outcomes, cluster_id)
+                    )
+                    selection_tiers['local'] += 1
+                    pbar.update(1)
+                else:
+                    # Members disagree - synthesize representative test
+                    selection_tiers['llm'] += 1
+                    llm_synthesis_reasons[disagreement or 'local_selection_disabled'] += 1
+                    try:
+                        representative_test = self._synthesize_cluster(
+                            cluster_tests, function_info, model_config, cluster_id
+                        )
+                        synthesized_tests.append(representative_test)
+                    except Exception as e:
+                        print(f"⚠️  Cluster {cluster_id} synthesis failed, using first test: {e}")
+                        synthesized_tests.append(cluster_tests[0])
+                    pbar.update(1)
+        
+        print(f"   🎯 Representatives: {selection_tiers['local']} selected locally, "
+              f"{selection_tiers['llm']} synthesized by LLM, {selection_tiers['singleton']} singletons")
+        if llm_synthesis_reasons:
+            reasons = ', '.join(f"{reason}: {count}" for reason, count in llm_synthesis_reasons.most_common())
+            print(f"   🤖 LLM synthesis reasons: {reasons}")
+        
+        # Stage 3: LLM-Powered Final Test File Generation
+        print("\n📝 Stage 3: LLM-Powered Final Test File Generation...")
+        print(f"   Using {self.finalizer_model} to generate clean, unified test file...")
+        
+        final_content = self._llm_finalize_test_file(synthesized_tests, function_info)
+        
+        # Extract final tests
+        final_tests = self._extract_tests_from_content(final_content, synthesized_tests)
+        
+        # Calculate statistics
+        reduction_ratio = (len(all_tests) - len(final_tests)) / len(all_tests) if len(all_tests) > 0 else 0
+        
+        print(f"\n✅ Hybrid synthesis complete!")
+        print(f"   📊 Original tests: {len(all_tests)}")
+        print(f"   🔬 Clusters identified: {len(clusters)}")
+        print(f"   ✨ Final unique tests: {len(final_tests)}")
+        print(f"   📉 Reduction: {reduction_ratio*100:.1f}%")
+        print("=" * 70)
+        
+        return {
+            'synthesized_content': final_content,
+            'final_tests': final_tests,
+            'original_count': len(all_tests),
+            'final_count': len(final_tests),
+            'cluster_count': len(clusters),
+            'reduction_ratio': reduction_ratio,
+            'synthesizer_model': best_model,
+            'finalizer_model': self.finalizer_model,
+            'clustering_method': clustering_method,
+            'selection_tiers': selection_tiers,
+            'llm_synthesis_reasons': dict(llm_synthesis_reasons),
+            'clusters': clusters  # Include cluster info for analysis
+        }
+    
+    def _quick_execute_tests(self, tests: List[Dict], indices: List[int], function_info: Dict,
+                             timeout: int = 30) -> Dict[int, bool]:
+        """
+        Run the given tests once, in a single pytest process, to learn which of them pass
+        
+        Args:
+            tests: All classified tests
+            indices: Indices of the tests to run
+            function_info: Information about the function under test
+            timeout: Seconds allowed for the whole run
+        
+        Returns test index -> passed. Tests that do not parse count as failed; tests whose
+        outcome is unknown (collection error, timeout) are left out.
+        """
+        if not indices:
+            return {}
+        
+        all_function_names = [f['name'] for f in function_info.get('functions', [])]
+        outcomes = {}
+        test_code = "import pytest\n"
+        if all_function_names:
+            test_code += f"from function import {', '.join(all_function_names)}\n"
+        
+        for idx in indices:
+            try:
+                tree = ast.parse(self._clean_synthesized_content(tests[idx]['code']))
+            except SyntaxError:
+                outcomes[idx] = False
+                continue
+            
+            # Rename so duplicate test names across models cannot shadow each other
+            for node in tree.body:
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == tests[idx]['name']:
+                    node.name = f"test_quick_{idx}"
+                    test_code += "\n\n" + ast.unparse(tree) + "\n"
+                    break
+        
+        work_dir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(work_dir, 'function.py'), 'w') as f:
+                f.write(function_info['source_code'])
+            with open(os.path.join(work_dir, 'test_quick.py'), 'w') as f:
+                f.write(test_code)
+            
+            run_pytest = functools.partial(
+                subprocess.run,
+                ['pytest', 'test_quick.py', '-v', '--tb=no', '-p', 'no:cacheprovider'],
+                cwd=work_dir,
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
+            # Share the pytest concurrency limit with coverage runs when an executor is set
+            result = self.executor.submit(run_pytest).result() if self.executor else run_pytest()
+            for name, status in re.findall(r'::test_quick_(\d+) (PASSED|FAILED|ERROR)', result.stdout):
+                outcomes[int(name)] = status == 'PASSED'
+        except subprocess.TimeoutExpired:
+            print(f"⚠️  Quick execution timed out after {timeout}s, selecting without pass/fail")
+        except Exception as e:
+            print(f"⚠️  Quick execution failed, selecting without pass/fail: {e}")
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        
+        return outcomes
+    
+    def _cluster_disagreement(self, cluster_tests: List[Dict], outcomes: List[Optional[bool]],
+                              function_info: Dict) -> Optional[str]:
+        """
+        Check whether cluster members disagree on behaviour or outcome
+        
+        A cluster is only safe for local selection when all members exercise the same
+        calls of the function under test with the same pytest.raises targets. A shared
+        structural hash is not enough: the normalizer replaces literals, so
+        ``sort_list([3, 1, 2])`` and ``sort_list([1, 2, 3])`` hash alike, and vector
+        clusters group tests of the same shape that call the function with different
+        inputs (i.e. cover different branches); picking one of them would drop the others.
+        
+        Returns the first disagreement found ('outcome', 'expected_exception',
+        'different_inputs' or 'expected_value'), or None when a locally selected
+        representative is safe. Members that do not parse are ignored; they simply lose
+        the local selection.
+        """
+        function_names = {f['name'] for f in function_info.get('functions', [])}
+        signatures = []
+        for test, outcome in zip(cluster_tests, outcomes):
+            code = self._clean_synthesized_content(test['code'])
+            try:
+                tree = ast.parse(code)
+            except SyntaxError:
+                continue
+            signatures.append((outcome, self._behaviour_signature(tree, function_names)))
+        
+        if len({outcome for outcome, _ in signatures if outcome is not None}) > 1:
+            return 'outcome'
+        
+        if len({raised for _, (raised, _, _) in signatures}) > 1:
+            return 'expected_exception'
+        
+        if len({calls for _, (_, _, calls) in signatures}) > 1:
+            return 'different_inputs'
+        
+        expected_by_call = {}
+        for _, (_, expected, _) in signatures:
+            for call, value in expected.items():
+                if expected_by_call.setdefault(call, value) != value:
+                    return 'expected_value'
+        
+        return None
+    
+    @staticmethod
+    def _behaviour_signature(tree: ast.AST, function_names: set) -> Tuple[frozenset, Dict[str, str], frozenset]:
+        """
+        Expected exceptions (pytest.raises), expected values per call (assert call == value)
+        and the calls made to the function(s) under test (all non-pytest calls if unknown)
+        
+        `result = f(x)` followed by `assert result == y` is resolved to the call `f(x)`.
+        """
+        raised = set()
+        expected = {}
+        assigned_calls = {}
+        calls = set()
+        
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        assigned_calls[target.id] = ast.unparse(node.value)
+        
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call):
+                callee = ast.unparse(node.func)
+                if callee == 'pytest.raises' and node.args:
+                    raised.add(ast.unparse(node.args[0]))
+                elif function_names:
+                    if callee.rsplit('.', 1)[-1] in function_names:
+                        calls.add(ast.unparse(node))
+                elif not callee.startswith('pytest.'):
+                    calls.add(ast.unparse(node))
+            elif (isinstance(node, ast.Assert) and isinstance(node.test, ast.Compare)
+                  and len(node.test.ops) == 1 and isinstance(node.test.ops[0], (ast.Eq, ast.Is))):
+                left, right = node.test.left, node.test.comparators[0]
+                if not isinstance(left, (ast.Call, ast.Name)):
+                    left, right = right, left
+                if isinstance(left, ast.Call):
+                    expected[ast.unparse(left)] = ast.unparse(right)
+                elif isinstance(left, ast.Name) and left.id in assigned_calls:
+                    expected[assigned_calls[left.id]] = ast.unparse(right)
+        
+        return frozenset(raised), expected, frozenset(calls)
+    
+    def _select_cluster_representative(self, cluster_tests: List[Dict], outcomes: List[Optional[bool]],
+                                       cluster_id: int) -> Dict:
+        """
+        Pick the best cluster member without an LLM call
+        
+        Each member is scored (weights in config.LOCAL_SELECTION) on passing the quick run,
+        assertion count, assertion message quality, agreement with the cluster's majority
+        category (as in consensus_vote_on_clusters) and centrality, i.e. mean AST-shape
+        similarity to the other members.
+        """
+        weights = self.llm_council.config.LOCAL_SELECTION['weights']
+        category_counts = Counter(test['category'] for test in cluster_tests)
+        consensus_category = category_counts.most_common(1)[0][0]
+        
+        cleaned_codes = [self._clean_synthesized_content(test['code']) for test in cluster_tests]
+        trees = []
+        for code in cleaned_codes:
+            try:
+                trees.append(ast.parse(code))
+            except SyntaxError:
+                trees.append(None)
+        shapes = [Counter(type(node).__name__ for node in ast.walk(tree)) if tree else Counter()
+                  for tree in trees]
+        
+        best_index, best_score = 0, None
+        for i, (test, tree) in enumerate(zip(cluster_tests, trees)):
+            if tree is None:
+                continue
+            
+            assertion_count, message_quality = self._assertion_quality(tree)
+            centrality = sum(
+                self._shape_similarity(shapes[i], shapes[j]) for j in range(len(shapes)) if j != i
+            ) / (len(shapes) - 1)
+            passed = outcomes[i]
+            
+            score = (weights['passes'] * (0.5 if passed is None else float(passed))
+                     + weights['assertions'] * min(assertion_count, 5) / 5
+                     + weights['messages'] * message_quality
+                     + weights['consensus'] * float(test['category'] == consensus_category)
+                     + weights['centrality'] * centrality)
+            
+            if best_score is None or score > best_score:
+                best_index, best_score = i, score
+        
+        representative = cluster_tests[best_index].copy()
+        representative['code'] = cleaned_codes[best_index]
+        representative['category'] = consensus_category
+        representative['category_votes'] = dict(category_counts)
+        representative['cluster_id'] = cluster_id
+        representative['cluster_size'] = len(cluster_tests)
+        representative['selection_score'] = round(best_score or 0.0, 3)
+        return representative
+    
+    @staticmethod
+    def _assertion_quality(tree: ast.AST) -> Tuple[int, float]:
+        """Number of checks (assert / pytest.raises) and the mean quality of their messages"""
+        checks = 0
+        message_points = 0.0
+        
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Assert):
+                checks += 1
+                if isinstance(node.msg, ast.JoinedStr):
+                    message_points += 1.0
+                elif isinstance(node.msg, ast.Constant) and isinstance(node.msg.value, str):
+                    # A few descriptive words beat a bare label
+                    message_points += 1.0 if len(node.msg.value.split()) >= 3 else 0.5
+                elif node.msg is not None:
+                    message_points += 0.5
+            elif isinstance(node, ast.Call) and ast.unparse(node.func) == 'pytest.raises':
+                checks += 1
+                if any(keyword.arg == 'match' for keyword in node.keywords):
+                    message_points += 1.0
+        
+        return checks, (message_points / checks if checks else 0.0)
+    
+    @staticmethod
+    def _shape_similarity(a: Counter, b: Counter) -> float:
+        """Weighted Jaccard similarity of two AST node-type histograms"""
+        union = sum((a | b).values())
+        return sum((a & b).values()) / union if union else 1.0
+    
+    def _synthesize_cluster(self, cluster_tests: List[Dict], function_info: Dict,
+                           model_config: Dict, cluster_id: int) -> Dict:
+        """Synthesize a single representative test from a cluster"""
+        func = function_info['functions'][0] if function_info['functions'] else {}
+        function_name = func.get('name', 'unknown_function')
+        
+        # Build cluster-specific prompt
+        prompt = f"""You are an expert test synthesis engineer. The following {len(cluster_tests)} test cases have been algorithmically identified as testing similar functionality through AST structural analysis.
+
+ORIGINAL FUNCTION UNDER TEST:
+```python
+{func.get('source_code', function_info['source_code'])}
+
+CLUSTERED TESTS (structurally similar):
+"""
+        
+        for i, test in enumerate(cluster_tests, 1):
+            prompt += f"\n--- Test {i} (from {test['source_model']}, role: {test.get('role_name', 'unknown')}) ---\n"
+            prompt += f"Category: {test['category']}\n"
+            prompt += f"```python\n{test['code']}\n```\n"
+        
+        prompt += f"""
+
+YOUR TASK:
+Create ONE superior "representative test" that captures the best aspects of all these similar tests.
+
+SYNTHESIS GUIDELINES:
+1. **Analyze Test Logic**: Identify what specific scenario/behavior all these tests are verifying
+2. **Select Best Elements**:
+   - Choose the clearest, most descriptive test name
+   - Use the most comprehensive assertion message
+   - Select input values that best represent the test scenario
+   - Keep the most readable code structure
+
+3. **Merge Insights**: If different tests check slightly different aspects:
+   - Combine assertions if they test the same logical path
+   - Keep the most thorough error checking
+   - Preserve important edge cases
+
+4. **Output Format**:
+   - Import statement: `from function import {function_name}`
+   - Single pytest function
+   - Include category comment from original tests
+   - Add clear docstring explaining what is tested
+   - NO markdown fences - just clean Python code
+
+CRITICAL: Output ONLY the synthesized test function code. No explanations, no markdown, just Python.
+
+Representative test:"""
+        
+        try:
+            if model_config["type"] == "openai":
+                response = self.llm_council.call_openai_model(prompt, model_config)
+                # Clean response
+                cleaned_code = self._clean_synthesized_content(response)
+                
+                # Extract test method
+                test_methods = CodeAnalyzer.extract_test_methods_from_response(cleaned_code)
+                
+                if test_methods:
+                    # Use the synthesized test
+                    representative = test_methods[0].copy()
+                    representative['category'] = cluster_tests[0]['category']  # Inherit category
+                    representative['source_model'] = 'synthesized'
+                    representative['source_role'] = 'cluster_synthesis'
+                    representative['role_name'] = f"Synthesized from cluster {cluster_id}"
+                    representative['cluster_id'] = cluster_id
+                    representative['cluster_size'] = len(cluster_tests)
+                    return representative
+                else:
+                    # Fallback to best test in cluster
+                    return cluster_tests[0]
+            else:
+                return cluster_tests[0]
+        except Exception as e:
+            print(f"⚠️  Synthesis error for cluster {cluster_id}: {e}")
+            return cluster_tests[0]
+    
+    def _llm_finalize_test_file(self, synthesized_tests: List[Dict], function_info: Dict) -> str:
+        """Use LLM to generate the final, clean test file with all synthesized tests"""
+        func = function_info['functions'][0] if function_info['functions'] else {}
+        function_name = func.get('name', 'unknown_function')
+        
+        # Extract all function names from function_info for import
+        all_function_names = [f['name'] for f in function_info.get('functions', [])]
+        if not all_function_names:
+            all_function_names = [function_name]
+        
+        # Organize tests by category
+        by_category = {}
+        for test in synthesized_tests:
+            category = test['category']
+            if category not in by_category:
+                by_category[category] = []
+            by_category[category].append(test)
+        
+        # Build comprehensive prompt for final generation
+        prompt = f"""You are an expert Python test engineer. Generate a COMPLETE, CLEAN, PRODUCTION-READY pytest test file.
+
+FUNCTION(S) UNDER TEST (saved in function.py):
+python
+{function_info['source_code']}
+
+CRITICAL IMPORT REQUIREMENT:
+The function(s) being tested are in a file called `function.py`. You MUST import them using:
+`from function import {', '.join(all_function_names)}`
+
+SYNTHESIZED TEST SCENARIOS:
+You have {len(synthesized_tests)} unique test scenarios to include. Here they are organized by category:
+
+"""
+        
+        for category in ['positive', 'negative', 'boundary', 'edge_case', 'security']:
+            if category not in by_category:
+                continue
+            
+            tests = by_category[category]
+            prompt += f"\n{'='*70}\n"
+            prompt += f"CATEGORY: {category.upper()} ({len(tests)} tests)\n"
+            prompt += f"{'='*70}\n"
+            
+            for i, test in enumerate(tests, 1):
+                prompt += f"\nTest {i}:\n"
+                prompt += f"```python\n{test['code']}\n```\n"
+        
+        prompt += f"""
+
+YOUR TASK:
+Generate a SINGLE, COMPLETE pytest test file that includes ALL {len(synthesized_tests)} test scenarios above.
+
+REQUIREMENTS:
+1. **File Header**: Add a clean docstring explaining this is an auto-generated comprehensive test suite
+2. **Imports Section**: 
+   - MUST include: `import pytest`
+   - MUST include: `from function import {', '.join(all_function_names)}`
+   - Include any other necessary imports (e.g., contextlib, etc.)
+3. **Organization**: Group tests by category with clear section comments
+4. **Naming Convention**: Use consistent, descriptive test names (e.g., test_<scenario>_<condition>)
+5. **Code Style**: Follow PEP 8, use clear assertions with messages
+6. **Completeness**: Include EVERY test scenario provided above
+7. **Clean Code**: No markdown fences in output, no redundant code
+
+CRITICAL: The import statement MUST be exactly: `from function import {', '.join(all_function_names)}`
+This is because the function(s) under test will be saved in a file called function.py.
+
+OUTPUT FORMAT:
+- Start with module docstring
+- Import section (pytest + function imports from function.py)
+- Test functions organized by category
+- Each category section has a header comment
+- NO markdown code fences in the output
+- Just clean, executable Python code
+
+Generate the complete test file now:"""
+        
+        try:
+            # Use Gemini Flash 2 for final generation
+            if self.finalizer_model in self.llm_council.models:
+                model_config = self.llm_council.models[self.finalizer_model]
+                
+                if model_config["type"] == "openai":
+                    response = self.llm_council.call_openai_model(prompt, model_config)
+                    final_content = self._clean_synthesized_content(response)
+                    
+                    # Verify the content has the required import statement
+                    required_import = f'from function import {", ".join(all_function_names)}'
+                    has_required_import = required_import in final_content or any(
+                        f'from function import {name}' in final_content for name in all_function_names
+                    )
+                    
+                    if has_required_import:
+                        print(f"✅ LLM-generated final test file created successfully")
+                        return final_content
+                    else:
+                        print(f"⚠️  LLM output missing required import statement, using fallback")
+                        return self._build_final_test_file_fallback(synthesized_tests, function_info)
+                else:
+                    return self._build_final_test_file_fallback(synthesized_tests, function_info)
+            else:
+                print(f"⚠️  Finalizer model {self.finalizer_model} not available, using fallback")
+                return self._build_final_test_file_fallback(synthesized_tests, function_info)
+                
+        except Exception as e:
+            print(f"⚠️  LLM finalization error: {e}, using fallback")
+            return self._build_final_test_file_fallback(synthesized_tests, function_info)
+    
+    def _build_final_test_file_fallback(self, synthesized_tests: List[Dict], function_info: Dict) -> str:
+        """Fallback method to build test file if LLM fails"""
+        func = function_info['functions'][0] if function_info['functions'] else {}
+        function_name = func.get('name', 'unknown_function')
+        
+        # Extract all function names for import
+        all_function_names = [f['name'] for f in function_info.get('functions', [])]
+        if not all_function_names:
+            all_function_names = [function_name]
+        
+        # Count statistics
+        cluster_synthesized = sum(1 for t in synthesized_tests if t.get('cluster_size', 1) > 1)
+        singleton_tests = len(synthesized_tests) - cluster_synthesized
+        
+        header = f'''"""
+Intelligent Test Suite - Hybrid Cluster-then-Synthesize Approach
+Generated by Role-Based LLM Council with AST-Clustered Deduplication
+
+Target Function(s): {', '.join(all_function_names)}
+Total Tests: {len(synthesized_tests)}
+  • Cluster-synthesized tests: {cluster_synthesized}
+  • Unique singleton tests: {singleton_tests}
+
+Pipeline:
+  1. Role-based test generation by specialized LLM agents
+  2. AST-based structural clustering for duplicate detection
+  3. Cluster-wise representative selection (local scoring, LLM synthesis on disagreement)
+  4. Final LLM-powered test file generation
+"""
+
+import pytest
+from function import {', '.join(all_function_names)}
+
+
+'''
+        
+        # Group by category
+        by_category = {}
+        for test in synthesized_tests:
+            category = test['category']
+            if category not in by_category:
+                by_category[category] = []
+            by_category[category].append(test)
+        
+        # Build test code organized by category
+        test_code = header
+        
+        for category in ['positive', 'negative', 'boundary', 'edge_case', 'security']:
+            if category not in by_category:
+                continue
+            
+            tests = by_category[category]
+            test_code += f"\n# {category.upper()} TESTS\n"
+            test_code += f"# {'='*70}\n\n"
+            
+            for test in tests:
+                test_code += test['code'] + "\n\n"
+        
+        return test_code
+    
+    def _extract_tests_from_content(self, content: str, synthesized_tests: List[Dict]) -> List[Dict]:
+        """Extract final test information from content"""
+        final_tests = []
+        
+        for test in synthesized_tests:
+            final_test = {
+                'name': test['name'],
+                'code': test['code'],
+                'category': test['category'],
+                'source': test.get('source_model', 'unknown'),
+                'cluster_id': test.get('cluster_id', -1),
+                'cluster_size': test.get('cluster_size', 1),
+                'is_synthesized': test.get('cluster_size', 1) > 1
+            }
+            final_tests.append(final_test)
+        
+        return final_tests
+    
+    def _clean_synthesized_content(self, content: str) -> str:
+        """Clean synthesized content by removing markdown artifacts"""
+        lines = content.split('\n')
+        cleaned_lines = []
+        
+        for line in lines:
+            stripped_line = line.strip()
+            
+            # Skip markdown code fence lines
+            if stripped_line in ['```python', '```py', '```', '```\n']:
+                continue
+            
+            # Remove leading markdown
+            if stripped_line.startswith('```python'):
+                line = line.replace('```python', '', 1)
+            elif stripped_line.startswith('```py'):
+                line = line.replace('```py', '', 1)
+            elif stripped_line.startswith('```') and stripped_line.endswith('```'):
+                continue
+            
+            cleaned_lines.append(line)
+        
+        cleaned_code = '\n'.join(cleaned_lines).strip()
+        
+        # Remove trailing backticks
+        while cleaned_code.endswith('```'):
+            cleaned_code = cleaned_code[:-3].strip()
+        
+        return cleaned_code
@@ -0,0 +1,106 @@
+"""Compact FunctionResult: round trip through results.json and release of pooled test code."""
+import gc
+import json
+
+import pytest
+
+from testgen_council import FunctionResult, RawResponseStore
+from testgen_council import TestCodePool as CodePool   # alias: not a pytest test class
+
+POSITIVE = "def test_sort():\n    assert sort_list([3, 1, 2]) == [1, 2, 3]\n"
+NEGATIVE = "def test_sort_rejects_none():\n    with pytest.raises(TypeError):\n        sort_list(None)\n"
+FINAL_FILE = "import pytest\nfrom function import sort_list\n\n\n" + POSITIVE + "\n\n" + NEGATIVE
+
+
+def legacy_results(output_dir):
+    """Minimal results dict in the layout produced by the pipeline"""
+    tests = [
+        {'name': 'test_sort', 'code': POSITIVE, 'category': 'positive',
+         'source_model': 'gemini-2.0-flash', 'source_role': 'qa_engineer',
+         'role_name': 'By-the-Book QA Engineer'},
+        {'name': 'test_sort_rejects_none', 'code': NEGATIVE, 'category': 'negative',
+         'source_model': 'grok-3-mini', 'source_role': 'agent_of_chaos', 'role_name': 'Agent of Chaos'},
+    ]
+    return {
+        'function_info': {'source_code': 'def sort_list(items):\n    return sorted(items)\n',
+                          'functions': [{'name': 'sort_list'}], 'total_functions': 1},
+        'council_results': {
+            'gemini-2.0-flash': {'qa_engineer': {
+                'role_name': 'By-the-Book QA Engineer', 'raw_response': f"```python\n{POSITIVE}```",
+                'test_methods': [{'name': 'test_sort', 'code': POSITIVE}], 'test_count': 1,
+                'focus_categories': ['positive', 'boundary']}},
+            'grok-3-mini': {'agent_of_chaos': {
+                'role_name': 'Agent of Chaos', 'raw_response': f"```python\n{NEGATIVE}```",
+                'test_methods': [{'name': 'test_sort_rejects_none', 'code': NEGATIVE}], 'test_count': 1,
+                'focus_categories': ['negative', 'edge_case']}},
+        },
+        'all_classified_tests': tests,
+        'synthesis_results': {
+            'synthesized_content': FINAL_FILE,
+            'final_tests': [dict(tests[0], source='gemini-2.0-flash', cluster_id=0, cluster_size=1),
+                            dict(tests[1], source='grok-3-mini', cluster_id=1, cluster_size=1)],
+            'original_count': 2, 'final_count': 2, 'cluster_count': 2, 'reduction_ratio': 0.0,
+            'synthesizer_model': 'gemini-2.0-flash', 'clusters': {0: [0], 1: [1]},
+        },
+        'final_test_file': FINAL_FILE,
+        'coverage_results': {'coverage_percentage': 100.0, 'coverage_data': {'totals': {'percent_covered': 100.0}},
+                             'test_results': '2 passed', 'test_stderr': '', 'total_tests': 2},
+        'output_dir': str(output_dir),
+        'statistics': {'original_test_count': 2, 'final_test_count': 2, 'coverage_percentage': 100.0},
+    }
+
+
+@pytest.fixture
+def blob_store(tmp_path):
+    return RawResponseStore(str(tmp_path / 'raw_responses'))
+
+
+def test_round_trip(tmp_path, blob_store):
+    results = legacy_results(tmp_path)
+    result = FunctionResult.from_results(results, CodePool(), blob_store)
+
+    path = tmp_path / 'results.json'
+    with open(path, 'w') as f:
+        json.dump(result.to_compact_dict(), f)
+
+    with open(path) as f:
+        data = json.load(f)
+    assert data['format'] == FunctionResult.COMPACT_FORMAT
+    assert sorted(data['tests'].values()) == sorted([POSITIVE, NEGATIVE])   # each test stored once
+    assert 'final_test_file' not in data and data['final_test_file_hash']
+
+    loaded = FunctionResult.load(str(path))
+    assert loaded.final_test_file == FINAL_FILE
+    assert loaded['council_results'] == results['council_results']
+    assert loaded['all_classified_tests'] == results['all_classified_tests']
+    assert loaded['coverage_results'] == results['coverage_results']
+    assert loaded['synthesis_results']['synthesized_content'] == FINAL_FILE
+    assert [t['code'] for t in loaded['synthesis_results']['final_tests']] == [POSITIVE, NEGATIVE]
+    assert loaded['statistics'] == results['statistics']
+
+
+def test_load_compact_v1(tmp_path, blob_store):
+    """v1 files kept the final test file inline"""
+    data = FunctionResult.from_results(legacy_results(tmp_path), CodePool(), blob_store).to_compact_dict()
+    data['format'] = 'testgen-council/compact-v1'
+    data['final_test_file'] = FINAL_FILE
+    del data['final_test_file_hash']
+
+    loaded = FunctionResult.from_compact_dict(data)
+    assert loaded.final_test_file == FINAL_FILE
+
+
+def test_pool_releases_codes_when_results_are_collected(tmp_path, blob_store):
+    code_pool = CodePool()
+    first = FunctionResult.from_results(legacy_results(tmp_path), code_pool, blob_store)
+    second = FunctionResult.from_compact_dict(first.to_compact_dict(), code_pool)
+    assert len(code_pool) == 2
+
+    del first
+    gc.collect()
+    assert len(code_pool) == 2   # still referenced by the second result
+    assert second['all_classified_tests'][0]['code'] == POSITIVE
+
+    del second
+    gc.collect()
+    assert len(code_pool) == 0
@@ -0,0 +1,111 @@
+"""POST /jobs validation and deduplication of TestGenerationService (LLM calls stubbed)."""
+import asyncio
+
+import pytest
+
+pytest.importorskip('aiohttp')
+from aiohttp.test_utils import TestClient, TestServer
+
+from testgen_council import Config, LLMCouncil
+from testgen_council.service import TestGenerationService as GenerationService   # alias: not a pytest test class
+
+FUNCTION_CODE = '''
+def divide(a, b):
+    """Divide a by b"""
+    if b == 0:
+        raise ValueError("division by zero")
+    return a / b
+'''
+
+LLM_RESPONSE = '''```python
+import pytest
+
+def test_divide_basic():
+    # Category: positive
+    assert divide(6, 3) == 2
+
+def test_divide_by_zero():
+    # Category: negative
+    with pytest.raises(ValueError):
+        divide(1, 0)
+```'''
+
+
+@pytest.fixture(autouse=True)
+def stub_llm(monkeypatch, tmp_path):
+    async def fake_call_async(self, prompt, model_config, model_name, role_id):
+        return model_name, role_id, LLM_RESPONSE
+
+    monkeypatch.setattr(LLMCouncil, 'call_openai_model_async', fake_call_async)
+    # Empty synthesis/finalizer responses: the pipeline falls back to its own test file
+    monkeypatch.setattr(LLMCouncil, 'call_openai_model', lambda self, prompt, model_config: '')
+    monkeypatch.chdir(tmp_path)   # raw response blob store is relative to the working directory
+
+
+def run_with_client(tmp_path, scenario):
+    """Run scenario(client) against a service app with its own data directory"""
+    async def main():
+        service = GenerationService(Config(), data_dir=str(tmp_path / 'service_data'))
+        async with TestClient(TestServer(service.create_app())) as client:
+            return await scenario(client)
+    return asyncio.run(main())
+
+
+async def wait_until_finished(client, job_id, timeout=120):
+    for _ in range(timeout * 10):
+        job = await (await client.get(f'/jobs/{job_id}')).json()
+        if job['status'] not in ('queued', 'running'):
+            return job
+        await asyncio.sleep(0.1)
+    raise AssertionError(f"Job {job_id} did not finish within {timeout}s")
+
+
+@pytest.mark.parametrize('body, error', [
+    ('not json', 'Request body must be JSON'),
+    ('["def f(): pass"]', 'Request body must be a JSON object'),
+    ('{}', "'function_code' is required"),
+    ('{"function_code": "   "}', "'function_code' is required"),
+    ('{"function_code": 42}', "'function_code' is required"),
+    ('{"function_code": "def f(): pass", "clustering_method": "kmeans"}', 'Unknown clustering method: kmeans'),
+    ('{"function_code": "def f(): pass", "iterative": "false"}', "'iterative' must be a boolean"),
+    ('{"function_code": "def f(): pass", "force": 1}', "'force' must be a boolean"),
+])
+def test_submit_rejects_invalid_payloads(tmp_path, body, error):
+    async def scenario(client):
+        response = await client.post('/jobs', data=body, headers={'Content-Type': 'application/json'})
+        return response.status, await response.json()
+
+    status, payload = run_with_client(tmp_path, scenario)
+    assert status == 400
+    assert payload == {'error': error}
+
+
+def test_identical_submissions_share_one_job(tmp_path):
+    async def scenario(client):
+        submit = {'function_code': FUNCTION_CODE, 'clustering_method': 'hash'}
+        first = await client.post('/jobs', json=submit)
+        first_job = await first.json()
+
+        # Formatting and comments are not part of the fingerprint
+        reformatted = dict(submit, function_code='# divide\n' + FUNCTION_CODE.replace('a / b', 'a/b'))
+        repeat = await client.post('/jobs', json=reformatted)
+        repeat_job = await repeat.json()
+
+        other_options = await client.post('/jobs', json=dict(submit, iterative=True))
+        forced = await client.post('/jobs', json=dict(submit, force=True))
+
+        jobs = [first_job, repeat_job, await other_options.json(), await forced.json()]
+        finished = [await wait_until_finished(client, job['job_id']) for job in jobs]
+        assert [job['status'] for job in finished] == ['completed'] * len(jobs)
+        result = await (await client.get(f"/jobs/{first_job['job_id']}/result")).json()
+        return [first.status, repeat.status, other_options.status, forced.status], jobs, result
+
+    statuses, jobs, result = run_with_client(tmp_path, scenario)
+    first_job, repeat_job, other_options_job, forced_job = jobs
+
+    assert statuses == [202, 200, 202, 202]
+    assert first_job['deduplicated'] is False
+    assert repeat_job['deduplicated'] is True
+    assert repeat_job['job_id'] == first_job['job_id']
+    assert len({first_job['job_id'], other_options_job['job_id'], forced_job['job_id']}) == 3
+    assert 'def test_divide_by_zero' in result['final_test_file']
@@ -0,0 +1,134 @@
+"""Cluster representative selection in TestSynthesizer (local selection vs LLM synthesis)."""
+import pytest
+
+from testgen_council import CodeAnalyzer, Config, LLMCouncil
+from testgen_council import TestSynthesizer as Synthesizer   # alias: not a pytest test class
+from testgen_council.clustering import ASTClusterer
+
+SORT_SOURCE = '''
+def sort_list(items):
+    """Return a new list with the items in ascending order"""
+    if not isinstance(items, list):
+        raise TypeError("items must be a list")
+    return sorted(items)
+'''
+
+
+def make_test(name, body, category='positive'):
+    return {'name': name, 'code': f"def {name}():\n{body}", 'category': category,
+            'source_model': 'gemini-2.0-flash', 'source_role': 'qa_engineer'}
+
+
+@pytest.fixture
+def synthesizer():
+    return Synthesizer(LLMCouncil(Config()))
+
+
+@pytest.fixture
+def function_info():
+    return CodeAnalyzer.extract_function_info(SORT_SOURCE)
+
+
+def test_agreeing_cluster_is_selected_locally(synthesizer, function_info):
+    cluster = [
+        make_test('test_sort', "    assert sort_list([3, 1, 2]) == [1, 2, 3]\n"),
+        make_test('test_sort_unordered',
+                  "    result = sort_list([3, 1, 2])\n"
+                  "    assert result == [1, 2, 3], 'items are sorted'\n"),
+        make_test('test_sort_again', "    assert sort_list([3, 1, 2]) == [1, 2, 3]\n", category='boundary'),
+    ]
+    outcomes = [True, True, True]
+
+    assert synthesizer._cluster_disagreement(cluster, outcomes, function_info) is None
+
+    representative = synthesizer._select_cluster_representative(cluster, outcomes, cluster_id=4)
+    assert representative['name'] == 'test_sort_unordered'   # only member with an assertion message
+    assert representative['category'] == 'positive'
+    assert representative['category_votes'] == {'positive': 2, 'boundary': 1}
+    assert representative['cluster_id'] == 4
+    assert representative['cluster_size'] == 3
+
+
+def test_outcome_disagreement(synthesizer, function_info):
+    cluster = [
+        make_test('test_sort', "    assert sort_list([3, 1, 2]) == [1, 2, 3]\n"),
+        make_test('test_sort', "    assert sort_list([3, 1, 2]) == [1, 2, 3]\n"),
+    ]
+    assert synthesizer._cluster_disagreement(cluster, [True, False], function_info) == 'outcome'
+    # Unknown outcomes (quick run skipped or timed out) are not a disagreement
+    assert synthesizer._cluster_disagreement(cluster, [True, None], function_info) is None
+
+
+def test_expected_exception_disagreement(synthesizer, function_info):
+    cluster = [
+        make_test('test_sort_rejects_string',
+                  "    with pytest.raises(TypeError):\n        sort_list('abc')\n", category='negative'),
+        make_test('test_sort_rejects_string',
+                  "    with pytest.raises(ValueError):\n        sort_list('abc')\n", category='negative'),
+    ]
+    assert synthesizer._cluster_disagreement(cluster, [None, None], function_info) == 'expected_exception'
+
+
+def test_expected_value_disagreement(synthesizer, function_info):
+    cluster = [
+        make_test('test_sort', "    assert sort_list([3, 1, 2]) == [1, 2, 3]\n"),
+        make_test('test_sort', "    assert sort_list([3, 1, 2]) == [3, 2, 1]\n"),
+    ]
+    assert synthesizer._cluster_disagreement(cluster, [None, None], function_info) == 'expected_value'
+
+
+def test_different_inputs_disagreement(synthesizer, function_info):
+    cluster = [
+        make_test('test_sort', "    assert sort_list([]) == []\n", category='boundary'),
+        make_test('test_sort_many', "    result = sort_list([5, 4, 3, 2, 1])\n    assert result[0] == 1\n"),
+    ]
+    assert synthesizer._cluster_disagreement(cluster, [True, True], function_info) == 'different_inputs'
+
+
+def test_sorted_literal_with_shared_hash_is_different_inputs(synthesizer, function_info):
+    """Literals are normalized away, so a shared structural hash does not mean identical inputs"""
+    cluster = [
+        make_test('test_sort', "    assert sort_list([3, 1, 2]) == [1, 2, 3]\n"),
+        make_test('test_sort', "    assert sort_list([1, 2, 3]) == [1, 2, 3]\n"),
+    ]
+    clusterer = ASTClusterer()
+    assert clusterer.get_structural_hash(cluster[0]['code']) == clusterer.get_structural_hash(cluster[1]['code'])
+
+    assert synthesizer._cluster_disagreement(cluster, [True, True], function_info) == 'different_inputs'
+
+
+def test_quick_execution_reports_pass_and_fail(synthesizer, function_info):
+    tests = [
+        make_test('test_sort', "    assert sort_list([3, 1, 2]) == [1, 2, 3]\n"),
+        make_test('test_sort', "    assert sort_list([3, 1, 2]) == [3, 2, 1]\n"),
+        make_test('test_broken', "    assert sort_list([3, 1, 2] ==\n"),
+    ]
+    outcomes = synthesizer._quick_execute_tests(tests, [0, 1, 2], function_info)
+    assert outcomes == {0: True, 1: False, 2: False}
+
+
+def test_synthesis_tiers(synthesizer, function_info, monkeypatch):
+    """Agreeing duplicates are selected locally; only the sorted-literal cluster reaches the LLM"""
+    prompts = []
+
+    def fake_call(prompt, model_config):
+        prompts.append(prompt)
+        return ''   # Empty response: cluster synthesis falls back, finalizer uses the template
+
+    monkeypatch.setattr(synthesizer.llm_council, 'call_openai_model', fake_call)
+    tests = [
+        make_test('test_sort', "    assert sort_list([3, 1, 2]) == [1, 2, 3]\n"),
+        make_test('test_sort', "    assert sort_list([1, 2, 3]) == [1, 2, 3]\n"),
+        make_test('test_sort_rejects_none',
+                  "    with pytest.raises(TypeError):\n        sort_list(None)\n", category='negative'),
+        make_test('test_sort_rejects_none',
+                  "    # None is not a list\n    with pytest.raises(TypeError):\n        sort_list(None)\n",
+                  category='negative'),
+    ]
+
+    results = synthesizer.synthesize_final_test_file(tests, function_info, clustering_method='hash')
+
+    assert results['selection_tiers'] == {'singleton': 0, 'local': 1, 'llm': 1}
+    assert results['llm_synthesis_reasons'] == {'different_inputs': 1}
+    assert len(prompts) == 2   # one cluster synthesis + the finalizer
+    assert 'sort_list(None)' in results['synthesized_content']